@@ -11,6 +11,7 @@ This package contains the essential functionality:
 # allowing a shorter import path elsewhere in your code.
 
 from .geometry import (
+    get_transformer,
     transform_polygon,
     calculate_corridor_polygon,
     # ... add other geometry functions as needed
@@ -20,6 +21,7 @@ from .file_operations import (
     get_las_files_from_directory,
     download_required_files,
     validate_las_file,
+    convert_las_to_txt,
     # ... add other file ops as needed
 )
 
@@ -27,6 +29,5 @@ from .processing import (
     process_corridor,
     process_las_file,
     select_las_files_for_corridor,
-    convert_las_to_txt,
     # ... add other processing functions as needed
 )
@@ -0,0 +1,138 @@
+"""
+bbox_index.py
+-------------
+Persistent cache of LAS/LAZ tile bounding boxes and CRS.
+
+Each source directory gets a small JSON file keyed by file name and validated
+by (mtime, size), so repeated corridor selections over the same tiles do not
+have to reopen every file.
+"""
+
+import functools
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import laspy
+from pyproj import CRS
+
+INDEX_FILENAME = ".las_bbox_index.json"
+
+# (min_x, min_y, max_x, max_y, crs_wkt)
+BBoxEntry = Tuple[float, float, float, float, Optional[str]]
+
+
+def _read_bbox(file_path: Path) -> BBoxEntry:
+    """
+    Read the XY bounding box and CRS of a LAS file from its header.
+    """
+    with laspy.open(file_path) as las:
+        min_x, min_y, _ = las.header.mins
+        max_x, max_y, _ = las.header.maxs
+        crs = las.header.parse_crs()
+    crs_wkt = crs.to_wkt() if crs is not None else None
+    return float(min_x), float(min_y), float(max_x), float(max_y), crs_wkt
+
+
+def _load_cache(index_path: Path) -> dict:
+    """
+    Load a directory's index file, returning an empty cache if missing or corrupt.
+    """
+    try:
+        with index_path.open("r", encoding="utf-8") as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(index_path: Path, cache: dict) -> None:
+    """
+    Atomically write a directory's index file; failures (e.g. read-only network
+    shares) only cost the cache, not the run.
+    """
+    tmp_path = index_path.with_name(index_path.name + ".tmp")
+    try:
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, index_path)
+    except OSError as exc:
+        logging.warning(f"Could not write bbox index {index_path}: {exc}")
+
+
+def _fresh_entry(cached: object, stat: os.stat_result) -> Optional[BBoxEntry]:
+    """
+    Return a cached entry if it still matches the file's mtime and size. Stale and
+    malformed entries both return None, so the header is simply read again.
+    """
+    try:
+        if cached["mtime"] == stat.st_mtime and cached["size"] == stat.st_size:
+            min_x, min_y, max_x, max_y = (float(v) for v in cached["bbox"])
+            crs_wkt = cached["crs_wkt"]
+            if crs_wkt is None or isinstance(crs_wkt, str):
+                return min_x, min_y, max_x, max_y, crs_wkt
+    except (KeyError, TypeError, ValueError):
+        pass
+    return None
+
+
+@functools.lru_cache(maxsize=32)
+def crs_from_wkt(crs_wkt: Optional[str]) -> Optional[CRS]:
+    """
+    Parse a CRS stored in the index (cached, since tiles usually share one CRS).
+
+    Args:
+        crs_wkt: The WKT string, or None if the tile has no CRS.
+
+    Returns:
+        The parsed CRS, or None.
+    """
+    return CRS.from_wkt(crs_wkt) if crs_wkt else None
+
+
+def load_or_build_index(files: List[Path]) -> Dict[Path, BBoxEntry]:
+    """
+    Return the bounding box and CRS of each file, using each directory's cached
+    index where it is still fresh and reading headers only for new or changed files.
+
+    Args:
+        files: The LAS/LAZ files to index.
+
+    Returns:
+        Mapping of file path to (min_x, min_y, max_x, max_y, crs_wkt). Files whose
+        header could not be read are logged and left out.
+    """
+    index: Dict[Path, BBoxEntry] = {}
+    files_by_dir: Dict[Path, List[Path]] = {}
+    for file_path in files:
+        files_by_dir.setdefault(file_path.parent, []).append(file_path)
+
+    for directory, dir_files in files_by_dir.items():
+        index_path = directory / INDEX_FILENAME
+        cache = _load_cache(index_path)
+        updated = False
+
+        for file_path in dir_files:
+            try:
+                stat = file_path.stat()
+                entry = _fresh_entry(cache.get(file_path.name), stat)
+                if entry is None:
+                    entry = _read_bbox(file_path)
+                    cache[file_path.name] = {
+                        "mtime": stat.st_mtime,
+                        "size": stat.st_size,
+                        "bbox": list(entry[:4]),
+                        "crs_wkt": entry[4],
+                    }
+                    updated = True
+            except Exception as exc:
+                logging.error(f"Error reading {file_path.name}: {exc}")
+                continue
+            index[file_path] = entry
+
+        if updated:
+            _save_cache(index_path, cache)
+
+    return index
@@ -8,14 +8,18 @@ File handling utilities for LAS corridor processing, including:
 - Converting LAS to TXT
 """
 
+import functools
 import logging
+import math
+import os
 import shutil
 import time
-from collections import defaultdict
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 import threading
 from pathlib import Path
-from typing import List, Tuple, Dict, Optional
+from typing import Deque, List, Tuple, Optional
 
 import laspy
 import numpy as np
@@ -31,12 +35,50 @@ def get_las_files_from_directory(directory: Path) -> List[Path]:
     Returns:
         A list of file paths for all LAS/LAZ files found.
     """
-    if not directory.exists():
+    try:
+        with os.scandir(directory) as entries:
+            return [
+                Path(entry.path)
+                for entry in entries
+                if entry.name.lower().endswith((".las", ".laz")) and entry.is_file()
+            ]
+    except FileNotFoundError:
         logging.warning(f"Directory {directory} does not exist. Please check the path.")
         return []
-    return [f for ext in ("*.las", "*.laz") for f in directory.glob(ext)]
+    except OSError as exc:
+        logging.error(f"Cannot list directory {directory}: {exc}")
+        return []
 
 
+# Standard ASPRS classification codes (LAS 1.4 R15)
+_STANDARD_CLASSIFICATIONS = {
+    0: "Created, never classified",
+    1: "Unassigned",
+    2: "Ground",
+    3: "Low Vegetation",
+    4: "Medium Vegetation",
+    5: "High Vegetation",
+    6: "Building",
+    7: "Low Point (noise)",
+    8: "Model Key-point",
+    9: "Water",
+    10: "Rail",
+    11: "Road Surface",
+    12: "Overlap Points",
+    13: "Wire - Guard (Shield)",
+    14: "Wire - Conductor (Phase)",
+    15: "Transmission Tower",
+    16: "Wire-structure Connector",
+    17: "Bridge Deck",
+    18: "High Noise",
+    19: "Overhead Structure",
+    20: "Ignored Ground",
+    21: "Snow",
+    22: "Temporal Exclusion",
+}
+
+
+@functools.lru_cache(maxsize=256)
 def get_classification_name(code: int) -> str:
     """
     Return a human-readable classification name for a given LAS classification code.
@@ -48,85 +90,64 @@ def get_classification_name(code: int) -> str:
     Returns:
         A descriptive classification name.
     """
-    standard_classifications = {
-        0: "Created, never classified",
-        1: "Unassigned",
-        2: "Ground",
-        3: "Low Vegetation",
-        4: "Medium Vegetation",
-        5: "High Vegetation",
-        6: "Building",
-        7: "Low Point (noise)",
-        8: "Model Key-point",
-        9: "Water",
-        10: "Rail",
-        11: "Road Surface",
-        12: "Overlap Points",
-        13: "Wire - Guard (Shield)",
-        14: "Wire - Conductor (Phase)",
-        15: "Transmission Tower",
-        16: "Wire-structure Connector",
-        17: "Bridge Deck",
-        18: "High Noise",
-        19: "Overhead Structure",
-        20: "Ignored Ground",
-        21: "Snow",
-        22: "Temporal Exclusion",
-    }
-
     if 23 <= code <= 63:
         return f"Reserved (ASPRS) [{code}]"
     if 64 <= code <= 255:
         return f"User Defined [{code}]"
-    return standard_classifications.get(code, f"Unknown [{code}]")
+    return _STANDARD_CLASSIFICATIONS.get(code, f"Unknown [{code}]")
 
 
-def inspect_las_file(file_path: Path, detailed: bool = True) -> str:
+def inspect_las_header(
+    header: laspy.LasHeader,
+    file_path: Path,
+    class_histogram: Optional[np.ndarray] = None,
+) -> str:
     """
-    Generate a textual report about a LAS file: header info, classification counts, etc.
+    Generate a textual report from an already-read LAS header.
 
     Args:
-        file_path: Path to the LAS file.
-        detailed: Whether to generate a detailed report.
+        header: The LAS header.
+        file_path: Path to the LAS file (for the title and file size).
+        class_histogram: Optional 256-bin classification histogram; when given, the
+            classification analysis is included.
 
     Returns:
         A formatted string report about the LAS file.
     """
-    try:
-        report = [
-            f"\nInspecting LAS file: {file_path}",
-            f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            "-" * 80,
-        ]
-
-        las = laspy.read(file_path)
-
-        report.append("FILE INFORMATION:")
-        report.append(f"Version: {las.header.version}")
-        report.append(f"Point Format ID: {las.header.point_format.id}")
-        report.append(f"Point Count: {las.header.point_count:,}")
-
-        file_size_bytes = file_path.stat().st_size
-        if file_size_bytes > 1024**3:
-            report.append(f"File Size: {file_size_bytes / (1024 ** 3):.2f} GB")
-        else:
-            report.append(f"File Size: {file_size_bytes / (1024 ** 2):.2f} MB")
-
-        report.append("\nCOORDINATE SYSTEM:")
-        report.append(f"X range: {las.header.min[0]:.3f} to {las.header.max[0]:.3f}")
-        report.append(f"Y range: {las.header.min[1]:.3f} to {las.header.max[1]:.3f}")
-        report.append(f"Z range: {las.header.min[2]:.3f} to {las.header.max[2]:.3f}")
-
-        scales = [float(x) for x in las.header.scales]
-        offsets = [float(x) for x in las.header.offsets]
-        report.append(f"Scale factors: {scales}")
-        report.append(f"Offsets: {offsets}")
+    report = [
+        f"\nInspecting LAS file: {file_path}",
+        f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "-" * 80,
+    ]
+
+    report.append("FILE INFORMATION:")
+    report.append(f"Version: {header.version}")
+    report.append(f"Point Format ID: {header.point_format.id}")
+    report.append(f"Point Count: {header.point_count:,}")
+
+    file_size_bytes = file_path.stat().st_size
+    if file_size_bytes > 1024**3:
+        report.append(f"File Size: {file_size_bytes / (1024 ** 3):.2f} GB")
+    else:
+        report.append(f"File Size: {file_size_bytes / (1024 ** 2):.2f} MB")
+
+    report.append("\nCOORDINATE SYSTEM:")
+    report.append(f"X range: {header.min[0]:.3f} to {header.max[0]:.3f}")
+    report.append(f"Y range: {header.min[1]:.3f} to {header.max[1]:.3f}")
+    report.append(f"Z range: {header.min[2]:.3f} to {header.max[2]:.3f}")
+
+    scales = [float(x) for x in header.scales]
+    offsets = [float(x) for x in header.offsets]
+    report.append(f"Scale factors: {scales}")
+    report.append(f"Offsets: {offsets}")
+
+    total_points = header.point_count
+    if class_histogram is not None:
+        unique_classes = np.flatnonzero(class_histogram)
+        class_counts = class_histogram[unique_classes]
 
         report.append("\nPOINT CLASSIFICATION ANALYSIS:")
 
-        unique_classes, class_counts = np.unique(las.classification, return_counts=True)
-        total_points = len(las.points)
-
         report.append("\nClassifications Found:")
         report.append("-" * 80)
         report.append(f"{'Code':<6} {'Name':<30} {'Count':<15} {'Percentage'}")
@@ -139,16 +160,42 @@ def inspect_las_file(file_path: Path, detailed: bool = True) -> str:
                 f"{int(class_code):<6} {name:<30} {count:<15,} {percentage:>6.2f}%"
             )
 
-        area = (las.header.max[0] - las.header.min[0]) * (
-            las.header.max[1] - las.header.min[1]
-        )
-        if area > 0:
-            density = total_points / area
-            report.append(f"\nApproximate Point Density: {density:.2f} points/m²")
-        else:
-            report.append("\nApproximate Point Density: Area is zero, cannot compute.")
+    area = (header.max[0] - header.min[0]) * (header.max[1] - header.min[1])
+    if area > 0:
+        density = total_points / area
+        report.append(f"\nApproximate Point Density: {density:.2f} points/m²")
+    else:
+        report.append("\nApproximate Point Density: Area is zero, cannot compute.")
+
+    return "\n".join(report)
+
 
-        return "\n".join(report)
+def inspect_las_file(file_path: Path, detailed: bool = True) -> str:
+    """
+    Generate a textual report about a LAS file: header info, classification counts, etc.
+
+    Args:
+        file_path: Path to the LAS file.
+        detailed: Whether to include the classification analysis. This is the only
+            part that reads point records; otherwise just the header is read.
+
+    Returns:
+        A formatted string report about the LAS file.
+    """
+    try:
+        with laspy.open(file_path) as reader:
+            header = reader.header
+            class_histogram = None
+            if detailed:
+                class_histogram = np.zeros(256, dtype=np.int64)
+                # Histogram classifications chunk by chunk; never decode the whole file
+                for chunk in reader.chunk_iterator(5_000_000):
+                    class_histogram += np.bincount(
+                        np.asarray(chunk.classification, dtype=np.uint8), minlength=256
+                    )
+                    del chunk
+
+        return inspect_las_header(header, file_path, class_histogram)
     except Exception as exc:
         return f"\nError inspecting file {file_path}: {str(exc)}"
 
@@ -192,8 +239,67 @@ def validate_las_file(file_path: Path) -> Tuple[bool, Optional[str], Optional[di
         return False, f"Validation error for {file_path}: {str(exc)}", None
 
 
+def _copy_one(
+    source_path: Path, local_directory: Path, link_if_possible: bool = False
+) -> Tuple[str, Optional[Path], Optional[str]]:
+    """
+    Copy a single file into the local directory unless an up-to-date copy exists.
+
+    Args:
+        source_path: The file to copy.
+        local_directory: The destination directory.
+        link_if_possible: Hardlink instead of copying when both are on one filesystem.
+
+    Returns:
+        (filename, destination_path, error)
+        destination_path: The copied file, or None if the copy was skipped or failed.
+        error: Error message if the copy failed, else None.
+    """
+    filename = source_path.name
+    destination_path = local_directory / filename
+
+    try:
+        if not source_path.exists():
+            logging.warning(f"Source not found: {filename}")
+            return filename, None, "Source not found"
+
+        src_stat = source_path.stat()
+        if destination_path.exists():
+            dst_stat = destination_path.stat()
+            # Same size and mtime (within FAT/SMB 2 s resolution) means up-to-date
+            if src_stat.st_size == dst_stat.st_size and math.isclose(
+                src_stat.st_mtime, dst_stat.st_mtime, abs_tol=2
+            ):
+                logging.info(f"Skipping {filename} (up-to-date)")
+                return filename, None, None
+
+        if link_if_possible and src_stat.st_dev == local_directory.stat().st_dev:
+            try:
+                if destination_path.exists():
+                    destination_path.unlink()
+                os.link(source_path, destination_path)
+                logging.info(f"Linked {filename} (same filesystem, no copy)")
+                return filename, destination_path, None
+            except OSError as exc:
+                logging.info(f"Cannot link {filename} ({exc}), copying instead")
+
+        logging.info(f"Copying {filename}...")
+        shutil.copy2(source_path, destination_path)
+        # Pin the source timestamps so the next run's comparison matches
+        os.utime(destination_path, (src_stat.st_atime, src_stat.st_mtime))
+        file_size = src_stat.st_size
+        logging.info(f"Copied {filename} ({file_size / (1024 ** 3):.2f} GB)")
+        return filename, destination_path, None
+    except Exception as exc:
+        logging.error(f"Error copying {filename}: {exc}")
+        return filename, None, str(exc)
+
+
 def download_required_files(
-    required_files: List[Path], network_directory: Path, local_directory: Path
+    required_files: List[Path],
+    network_directory: Path,
+    local_directory: Path,
+    link_if_possible: bool = False,
 ) -> Tuple[List[Path], List[str], List[str]]:
     """
     Download required LAS files from a network directory to a local directory.
@@ -203,6 +309,8 @@ def download_required_files(
         required_files: Files needed from the network.
         network_directory: The network directory path.
         local_directory: The local directory path.
+        link_if_possible: Hardlink files instead of copying them when the network
+            directory is on the same filesystem as the local one.
 
     Returns:
         (downloaded_files, skipped_files, failed_files)
@@ -228,33 +336,24 @@ def download_required_files(
         logging.info(f"Total download size: {total_size / (1024 ** 3):.2f} GB")
 
     copied_size = 0
-    for file_path in required_files:
-        filename = file_path.name
-        source_path = file_path
-        destination_path = local_directory / filename
+    # Copies are network-bound, so overlap them across a small thread pool
+    max_workers = max(1, min(8, len(required_files)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(
+            executor.map(
+                lambda f: _copy_one(f, local_directory, link_if_possible),
+                required_files,
+            )
+        )
 
-        try:
-            if source_path.exists():
-                if destination_path.exists():
-                    source_mtime = source_path.stat().st_mtime
-                    dest_mtime = destination_path.stat().st_mtime
-                    if source_mtime <= dest_mtime:
-                        logging.info(f"Skipping {filename} (up-to-date)")
-                        skipped_files.append(filename)
-                        continue
-
-                logging.info(f"Copying {filename}...")
-                shutil.copy2(source_path, destination_path)
-                file_size = source_path.stat().st_size
-                copied_size += file_size
-                logging.info(f"Copied {filename} ({file_size / (1024 ** 3):.2f} GB)")
-                downloaded_files.append(destination_path)
-            else:
-                failed_files.append(filename)
-                logging.warning(f"Source not found: {filename}")
-        except Exception as exc:
+    for filename, destination_path, error in results:
+        if error is not None:
             failed_files.append(filename)
-            logging.error(f"Error copying {filename}: {exc}")
+        elif destination_path is None:
+            skipped_files.append(filename)
+        else:
+            copied_size += destination_path.stat().st_size
+            downloaded_files.append(destination_path)
 
     logging.info("Download summary:")
     logging.info(
@@ -269,6 +368,19 @@ def download_required_files(
     return downloaded_files, skipped_files, failed_files
 
 
+# Points per TXT block handed to a formatting worker
+_TXT_BLOCK_POINTS = 1_000_000
+
+
+def _format_txt_block(block: np.ndarray) -> bytes:
+    """
+    Format an (N, 4) array of class_code,x,y,z rows as encoded TXT lines in one
+    C-level string-format call instead of formatting row by row.
+    """
+    text = ("%d,%.3f,%.3f,%.3f\n" * len(block)) % tuple(block.ravel().tolist())
+    return text.encode("ascii")
+
+
 def convert_las_to_txt(
     las_file: Path,
     txt_file: Optional[Path] = None,
@@ -289,55 +401,105 @@ def convert_las_to_txt(
     if txt_file is None:
         txt_file = las_file.with_suffix(".txt")
 
-    classification_counts: Dict[int, int] = defaultdict(int)
-    points_by_class: Dict[int, List[Tuple[float, float, float]]] = defaultdict(list)
-
     try:
         start_time = time.time()
         logging.info(f"Converting {las_file.name} to TXT...")
 
+        class_counts = np.zeros(256, dtype=np.int64)
+        class_chunks: List[np.ndarray] = []
+        x_chunks: List[np.ndarray] = []
+        y_chunks: List[np.ndarray] = []
+        z_chunks: List[np.ndarray] = []
+
         with laspy.open(las_file) as las:
             total_points = las.header.point_count
+            sx, sy, sz = (float(v) for v in las.header.scales)
+            ox, oy, oz = (float(v) for v in las.header.offsets)
             chunk_size = 1_000_000
             processed = 0
+            last_logged_progress = -10.0
 
             for points_chunk in las.chunk_iterator(chunk_size):
                 if cancel_event and cancel_event.is_set():
                     logging.info("Conversion canceled.")
                     return False
 
-                classifications = points_chunk.classification
-                xs = points_chunk.x
-                ys = points_chunk.y
-                zs = points_chunk.z
-
-                for c, x_val, y_val, z_val in zip(classifications, xs, ys, zs):
-                    c_code = int(c)
-                    points_by_class[c_code].append((x_val, y_val, z_val))
-                    classification_counts[c_code] += 1
+                # Keep raw integer coordinates; scaling happens per block on write.
+                # The fields are copied out (not viewed) so each chunk's full
+                # record buffer can be freed once the loop moves on.
+                classification = np.array(points_chunk.classification, dtype=np.uint8)
+                class_counts += np.bincount(classification, minlength=256)
+                class_chunks.append(classification)
+                x_chunks.append(np.array(points_chunk.X, dtype=np.int32))
+                y_chunks.append(np.array(points_chunk.Y, dtype=np.int32))
+                z_chunks.append(np.array(points_chunk.Z, dtype=np.int32))
 
                 processed += len(points_chunk)
                 progress = (processed / total_points) * 100
-                # Example: you could log progress in intervals
-                if int(progress) % 10 == 0:
-                    logging.info(f"Reading {progress:.1f}%")
+                if progress >= last_logged_progress + 10:
+                    logging.info("Reading %.1f%%", progress)
+                    last_logged_progress = progress
+
+        if not class_chunks:
+            txt_file.write_text("", encoding="utf-8")
+            logging.info("Conversion complete: 0 points (empty file)")
+            return True
+
+        classifications = np.concatenate(class_chunks)
+        xs = np.concatenate(x_chunks)
+        ys = np.concatenate(y_chunks)
+        zs = np.concatenate(z_chunks)
+        del class_chunks, x_chunks, y_chunks, z_chunks
 
         logging.info("Sorting and writing points to TXT...")
+        # Sort by classification, then X, then Y (last key is the primary one)
+        order = np.lexsort((ys, xs, classifications))
+
         written = 0
-        with txt_file.open("w", encoding="utf-8") as outfile:
-            for c_code in sorted(points_by_class.keys()):
-                sorted_points = sorted(
-                    points_by_class[c_code], key=lambda p: (p[0], p[1])
-                )
-                for x_val, y_val, z_val in sorted_points:
+        block_size = _TXT_BLOCK_POINTS
+        num_blocks = -(-len(order) // block_size)
+        # Formatting holds the GIL, so blocks are formatted in worker processes and
+        # written back in order; small files skip the pool start-up cost entirely.
+        max_workers = min(os.cpu_count() or 1, num_blocks)
+        executor = ProcessPoolExecutor(max_workers) if max_workers > 1 else None
+        pending: Deque[Future] = deque()
+        try:
+            # Binary mode with a 16 MiB buffer: blocks arrive pre-encoded
+            with txt_file.open("wb", buffering=16 * 1024 * 1024) as outfile:
+                for start in range(0, len(order), block_size):
                     if cancel_event and cancel_event.is_set():
                         logging.info("Conversion canceled during write.")
                         return False
-                    outfile.write(f"{c_code},{x_val:.3f},{y_val:.3f},{z_val:.3f}\n")
-                    written += 1
+                    idx = order[start : start + block_size]
+                    block = np.empty((len(idx), 4), dtype=np.float64)
+                    # Apply scale/offset only here, on the sorted block, in place
+                    block[:, 0] = classifications[idx]
+                    np.multiply(xs[idx], sx, out=block[:, 1])
+                    np.multiply(ys[idx], sy, out=block[:, 2])
+                    np.multiply(zs[idx], sz, out=block[:, 3])
+                    block[:, 1:] += (ox, oy, oz)
+
+                    if executor is None:
+                        outfile.write(_format_txt_block(block))
+                    else:
+                        pending.append(executor.submit(_format_txt_block, block))
+                        # Bound the number of in-flight blocks to cap memory
+                        if len(pending) >= 2 * max_workers:
+                            outfile.write(pending.popleft().result())
+                    written += len(idx)
+
+                while pending:
+                    outfile.write(pending.popleft().result())
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
 
         elapsed = time.time() - start_time
         logging.info(f"Conversion complete: {written:,} points in {elapsed:.2f}s")
+        for c_code in np.flatnonzero(class_counts):
+            logging.info(
+                f"  {get_classification_name(int(c_code))}: {class_counts[c_code]:,}"
+            )
         return True
 
     except Exception as exc:
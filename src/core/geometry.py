@@ -4,13 +4,73 @@ geometry.py
 Geometry-related functions for corridor creation and point-in-polygon checks.
 """
 
+import functools
+import logging
 import math
-from typing import Optional
+from typing import Optional, Tuple
 import numpy as np
-from shapely.geometry import Polygon, Point
-from shapely import ops as shapely_ops
+import shapely
+from shapely.geometry import Polygon
 from pyproj import CRS, Transformer
 
+from .pip_numba import NUMBA_AVAILABLE
+
+if NUMBA_AVAILABLE:
+    from .pip_numba import pip_quad, pip_ray
+
+# Cleared the first time a compiled kernel fails (e.g. an unloadable cache entry);
+# from then on the NumPy/GEOS paths are used
+_numba_usable = NUMBA_AVAILABLE
+
+
+def _disable_numba(exc: Exception) -> None:
+    """
+    Stop using the Numba kernels after a failure, warning once.
+    """
+    global _numba_usable
+    if _numba_usable:
+        logging.warning(
+            f"Numba point-in-polygon kernel failed ({exc!r}); "
+            "falling back to NumPy/GEOS."
+        )
+    _numba_usable = False
+
+
+def _crs_key(crs: CRS) -> str:
+    """
+    Return a hashable identifier for a CRS: "EPSG:<code>" when the CRS matches an
+    EPSG definition exactly, otherwise its WKT.
+    """
+    epsg = crs.to_epsg(min_confidence=100)
+    return f"EPSG:{epsg}" if epsg is not None else crs.to_wkt()
+
+
+@functools.lru_cache(maxsize=32)
+def _get_transformer(source_key: str, target_key: str) -> Transformer:
+    """
+    Build (once per CRS pair) an always_xy Transformer between two CRS keys.
+    """
+    return Transformer.from_crs(
+        CRS.from_user_input(source_key),
+        CRS.from_user_input(target_key),
+        always_xy=True,
+    )
+
+
+def get_transformer(source_crs: CRS, target_crs: CRS) -> Transformer:
+    """
+    Return a cached always_xy Transformer from source_crs to target_crs.
+    PROJ pipelines are expensive to build, so one is shared per CRS pair.
+
+    Args:
+        source_crs: The CRS to transform from.
+        target_crs: The CRS to transform to.
+
+    Returns:
+        The Transformer for the CRS pair.
+    """
+    return _get_transformer(_crs_key(source_crs), _crs_key(target_crs))
+
 
 def transform_polygon(polygon: Polygon, source_crs: CRS, target_crs: CRS) -> Polygon:
     """
@@ -22,11 +82,22 @@ def transform_polygon(polygon: Polygon, source_crs: CRS, target_crs: CRS) -> Pol
         target_crs: The target CRS for transformation.
 
     Returns:
-        A Polygon transformed into the target CRS.
+        A Polygon transformed into the target CRS (the input polygon if the CRS match).
     """
-    if not source_crs.equals(target_crs):
-        transformer = Transformer.from_crs(source_crs, target_crs, always_xy=True)
-        return shapely_ops.transform(transformer.transform, polygon)
+    if source_crs.equals(target_crs):
+        return polygon
+    transformer = get_transformer(source_crs, target_crs)
+
+    def transform_ring(ring) -> np.ndarray:
+        # One PROJ call per ring instead of one Python callback per vertex
+        coords = np.asarray(ring.coords)
+        xs, ys = transformer.transform(coords[:, 0], coords[:, 1])
+        return np.column_stack((xs, ys))
+
+    return Polygon(
+        transform_ring(polygon.exterior),
+        [transform_ring(interior) for interior in polygon.interiors],
+    )
 
 
 def calculate_corridor_polygon(
@@ -50,14 +121,16 @@ def calculate_corridor_polygon(
     """
     dx = x_end - x_start
     dy = y_end - y_start
-    angle = math.atan2(dy, dx)
-    perpendicular_angle = angle + (math.pi / 2)
+    length = math.hypot(dx, dy)
+    # Unit direction along the segment and its left-hand perpendicular
+    ux, uy = (dx / length, dy / length) if length > 0 else (1.0, 0.0)
+    px, py = -uy, ux
 
-    buffer_x = corridor_half_width * math.cos(perpendicular_angle)
-    buffer_y = corridor_half_width * math.sin(perpendicular_angle)
+    buffer_x = corridor_half_width * px
+    buffer_y = corridor_half_width * py
 
-    end_buffer_x = corridor_half_width * math.cos(angle)
-    end_buffer_y = corridor_half_width * math.sin(angle)
+    end_buffer_x = corridor_half_width * ux
+    end_buffer_y = corridor_half_width * uy
 
     corners = [
         (x_start - end_buffer_x + buffer_x, y_start - end_buffer_y + buffer_y),
@@ -68,8 +141,108 @@ def calculate_corridor_polygon(
     return Polygon(corners)
 
 
+@functools.lru_cache(maxsize=8)
+def _exterior_vertices(polygon: Polygon) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return the closed exterior ring of a polygon as contiguous x and y arrays.
+    Cached so repeated chunks against the same polygon skip the extraction.
+    """
+    coords = np.asarray(polygon.exterior.coords, dtype=np.float64)
+    return np.ascontiguousarray(coords[:, 0]), np.ascontiguousarray(coords[:, 1])
+
+
+def _convex_quad_corners(polygon: Polygon) -> Optional[np.ndarray]:
+    """
+    Return the 4 corners of a polygon as a counter-clockwise (4, 2) array if the
+    polygon is a convex quadrilateral without holes, otherwise None.
+    """
+    if polygon.interiors or len(polygon.exterior.coords) != 5:
+        return None
+
+    corners = np.asarray(polygon.exterior.coords, dtype=np.float64)[:4]
+    edges = np.roll(corners, -1, axis=0) - corners
+    turns = edges[:, 0] * np.roll(edges[:, 1], -1) - edges[:, 1] * np.roll(
+        edges[:, 0], -1
+    )
+    if np.all(turns > 0):
+        return corners
+    if np.all(turns < 0):
+        return corners[::-1].copy()
+    return None
+
+
+# Up to this many vertices GEOS beats the compiled ray-crossing kernel
+_SMALL_POLYGON_VERTICES = 8
+
+
+@functools.lru_cache(maxsize=8)
+def _pip_strategy(polygon: Polygon) -> Tuple[str, Optional[np.ndarray]]:
+    """
+    Pick the point-in-polygon implementation for a polygon, cached per polygon.
+
+    Returns:
+        ("quad", corners) for convex quadrilaterals, ("ray", None) for larger
+        hole-free polygons when Numba is available, otherwise ("geos", None).
+    """
+    corners = _convex_quad_corners(polygon)
+    if corners is not None:
+        return "quad", corners
+    num_vertices = len(polygon.exterior.coords) - 1
+    if (
+        NUMBA_AVAILABLE
+        and not polygon.interiors
+        and num_vertices > _SMALL_POLYGON_VERTICES
+    ):
+        return "ray", None
+    return "geos", None
+
+
+def points_in_convex_quad(
+    x_coords: np.ndarray, y_coords: np.ndarray, corners: np.ndarray
+) -> np.ndarray:
+    """
+    Determine which points lie inside a convex quadrilateral using the sign of the
+    cross product against each edge. Much cheaper than a general GEOS test for the
+    rectangles produced by calculate_corridor_polygon. Points on the boundary are
+    outside, matching shapely.contains_xy.
+
+    Args:
+        x_coords: X-coordinates of points.
+        y_coords: Y-coordinates of points.
+        corners: (4, 2) array of corners in counter-clockwise order.
+
+    Returns:
+        Boolean np.ndarray mask indicating which points are inside the quad.
+    """
+    if _numba_usable:
+        # One pass over x/y instead of four NumPy temporaries
+        mask = np.empty(x_coords.shape, dtype=bool)
+        try:
+            pip_quad(
+                np.ascontiguousarray(x_coords, dtype=np.float64),
+                np.ascontiguousarray(y_coords, dtype=np.float64),
+                np.ascontiguousarray(corners[:, 0]),
+                np.ascontiguousarray(corners[:, 1]),
+                mask,
+            )
+            return mask
+        except Exception as exc:
+            _disable_numba(exc)
+
+    mask = np.ones(x_coords.shape, dtype=bool)
+    for i in range(4):
+        px, py = corners[i]
+        qx, qy = corners[(i + 1) % 4]
+        mask &= (qx - px) * (y_coords - py) - (qy - py) * (x_coords - px) > 0
+    return mask
+
+
 def points_in_polygon_chunk(
-    x_coords: np.ndarray, y_coords: np.ndarray, polygon: Polygon
+    x_coords: np.ndarray,
+    y_coords: np.ndarray,
+    polygon: Polygon,
+    bounds: Optional[Tuple[float, float, float, float]] = None,
+    out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     """
     Efficiently determine which points lie inside a polygon using vectorized Shapely operations.
@@ -78,30 +251,56 @@ def points_in_polygon_chunk(
         x_coords: X-coordinates of points.
         y_coords: Y-coordinates of points.
         polygon: Polygon to test points against.
+        bounds: Precomputed polygon.bounds, to avoid recomputing it per chunk.
+        out: Optional boolean array (same length as the coordinates) to write the
+            mask into, so callers can reuse one buffer across chunks.
 
     Returns:
         Boolean np.ndarray mask indicating which points are inside the polygon.
     """
-    min_x, min_y, max_x, max_y = polygon.bounds
-    points_within_bounds = (
-        (x_coords >= min_x)
-        & (x_coords <= max_x)
-        & (y_coords >= min_y)
-        & (y_coords <= max_y)
-    )
+    x_coords = np.ascontiguousarray(x_coords, dtype=np.float64)
+    y_coords = np.ascontiguousarray(y_coords, dtype=np.float64)
 
-    if not np.any(points_within_bounds):
-        return np.zeros_like(points_within_bounds, dtype=bool)
+    min_x, min_y, max_x, max_y = polygon.bounds if bounds is None else bounds
+    # Cheap bbox rejection first; the comparisons are fused in place into one mask
+    if out is None:
+        out = np.empty(x_coords.shape, dtype=bool)
+    points_within_bounds = np.greater_equal(x_coords, min_x, out=out)
+    points_within_bounds &= x_coords <= max_x
+    points_within_bounds &= y_coords >= min_y
+    points_within_bounds &= y_coords <= max_y
 
-    filtered_x = x_coords[points_within_bounds]
-    filtered_y = y_coords[points_within_bounds]
-    candidate_points = np.column_stack((filtered_x, filtered_y))
+    num_within_bounds = np.count_nonzero(points_within_bounds)
+    if num_within_bounds == 0:
+        return points_within_bounds
 
-    # Vectorized point-in-polygon check
-    candidate_mask = np.array(
-        [polygon.contains(Point(xy)) for xy in candidate_points], dtype=bool
-    )
+    strategy, corners = _pip_strategy(polygon)
 
-    result_mask = np.zeros_like(points_within_bounds, dtype=bool)
-    result_mask[points_within_bounds] = candidate_mask
-    return result_mask
+    def contains(xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        if strategy == "quad":
+            return points_in_convex_quad(xs, ys, corners)
+        if strategy == "ray" and _numba_usable:
+            # Compiled ray-crossing test; small polygons and holes go through GEOS
+            vx, vy = _exterior_vertices(polygon)
+            mask = np.empty(xs.shape, dtype=bool)
+            try:
+                pip_ray(xs, ys, vx, vy, mask)
+                return mask
+            except Exception as exc:
+                _disable_numba(exc)
+        # Vectorized point-in-polygon check (single GEOS loop over the arrays);
+        # preparing is a no-op once done, and the polygon is reused for every chunk
+        shapely.prepare(polygon)
+        return shapely.contains_xy(polygon, xs, ys)
+
+    # When most points pass the bbox test, the gather/scatter costs more than it saves
+    if num_within_bounds > points_within_bounds.size // 2:
+        points_within_bounds &= contains(x_coords, y_coords)
+        return points_within_bounds
+
+    # Refine the bbox hits in place; everything else is already False
+    candidates = np.flatnonzero(points_within_bounds)
+    points_within_bounds[candidates] = contains(
+        x_coords[candidates], y_coords[candidates]
+    )
+    return points_within_bounds
@@ -0,0 +1,94 @@
+"""
+pip_numba.py
+------------
+Optional Numba-compiled point-in-polygon kernels.
+
+Numba is not a required dependency. When it is not installed, NUMBA_AVAILABLE
+is False and geometry.py falls back to its NumPy implementations.
+
+The kernels are deliberately serial (no parallel=True/prange): they are called
+from worker threads and before ProcessPool forks, where Numba's parallel
+threading layers can abort or hang the process. They are compiled with
+nogil=True instead, so the per-file worker threads can run them concurrently.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(nogil=True, cache=True)
+    def pip_quad(
+        xs: np.ndarray,
+        ys: np.ndarray,
+        cx: np.ndarray,
+        cy: np.ndarray,
+        out: np.ndarray,
+    ) -> None:
+        """
+        Test points against a convex quadrilateral in a single pass over x/y.
+
+        Args:
+            xs, ys: Contiguous float64 point coordinates.
+            cx, cy: The 4 corner coordinates in counter-clockwise order.
+            out: Boolean array receiving the inside mask (same length as xs).
+        """
+        for i in range(xs.shape[0]):
+            xi = xs[i]
+            yi = ys[i]
+            inside = True
+            for e in range(4):
+                n = (e + 1) % 4
+                # Points on an edge are outside, as with shapely's contains
+                if (cx[n] - cx[e]) * (yi - cy[e]) - (cy[n] - cy[e]) * (xi - cx[e]) <= 0:
+                    inside = False
+                    break
+            out[i] = inside
+
+    @njit(nogil=True, cache=True)
+    def pip_ray(
+        xs: np.ndarray,
+        ys: np.ndarray,
+        vx: np.ndarray,
+        vy: np.ndarray,
+        out: np.ndarray,
+    ) -> None:
+        """
+        Test points against a simple polygon ring with the even-odd ray-crossing rule.
+        Points on the ring are outside, matching shapely.contains_xy.
+
+        Args:
+            xs, ys: Contiguous float64 point coordinates.
+            vx, vy: Closed ring vertex coordinates (last vertex equals the first).
+            out: Boolean array receiving the inside mask (same length as xs).
+        """
+        num_edges = vx.shape[0] - 1
+        for i in range(xs.shape[0]):
+            x = xs[i]
+            y = ys[i]
+            inside = False
+            for j in range(num_edges):
+                x0 = vx[j]
+                y0 = vy[j]
+                x1 = vx[j + 1]
+                y1 = vy[j + 1]
+                # Points on an edge are on the boundary, hence outside
+                if (
+                    min(y0, y1) <= y <= max(y0, y1)
+                    and min(x0, x1) <= x <= max(x0, x1)
+                    and (x1 - x0) * (y - y0) == (y1 - y0) * (x - x0)
+                ):
+                    inside = False
+                    break
+                if (y1 > y) != (y0 > y):
+                    x_cross = (x0 - x1) * (y - y1) / (y0 - y1) + x1
+                    if x < x_cross:
+                        inside = not inside
+            out[i] = inside
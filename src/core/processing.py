@@ -10,19 +10,24 @@ Core logic for corridor-based LAS processing:
 
 import logging
 import math
+import os
 import time
 import threading
 import queue
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Tuple, Dict
+from typing import Callable, Iterator, List, Optional, Tuple, Dict
 
 import laspy
 import numpy as np
-from pyproj import CRS, Transformer
+from pyproj import CRS
 from shapely.geometry import Polygon, box
+from shapely.prepared import prep
 
 # Import from our own modules:
+from .bbox_index import crs_from_wkt, load_or_build_index
 from .geometry import (
+    get_transformer,
     transform_polygon,
     calculate_corridor_polygon,
     points_in_polygon_chunk,
@@ -32,8 +37,62 @@ from .file_operations import (
     validate_las_file,
     download_required_files,
     inspect_las_file,
+    inspect_las_header,
 )
 
+# Files processed concurrently; more threads only add memory and disk contention
+_MAX_FILE_WORKERS = 4
+# Filtered records buffered before a write, shared out across the file workers
+_WRITE_BUFFER_POINTS = 5_000_000
+
+
+class _CorridorProgress:
+    """
+    Combine per-file progress into one corridor-wide percentage, weighting each
+    file by its size, and put it on the GUI queue only when it changes. Safe to
+    update from several worker threads.
+    """
+
+    def __init__(self, queue_obj: queue.Queue, file_sizes: List[int]):
+        self.queue = queue_obj
+        total_size = sum(file_sizes) or 1
+        self.weights = [size / total_size for size in file_sizes]
+        self.file_percent = [0] * len(file_sizes)
+        self.weighted_sum = 0.0
+        self.last_sent = -1
+        self.lock = threading.Lock()
+
+    def update(self, file_index: int, percent: int) -> None:
+        with self.lock:
+            self.weighted_sum += self.weights[file_index] * (
+                percent - self.file_percent[file_index]
+            )
+            self.file_percent[file_index] = percent
+            progress = min(100, int(self.weighted_sum + 1e-9))
+            if progress != self.last_sent:
+                self.queue.put(("UPDATE_PROGRESS", progress))
+                self.last_sent = progress
+
+    def for_file(self, file_index: int) -> "_FileProgressQueue":
+        return _FileProgressQueue(self, file_index)
+
+
+class _FileProgressQueue:
+    """
+    Stand-in for the GUI queue handed to process_las_file: its per-file progress
+    updates feed the corridor total, anything else is passed through.
+    """
+
+    def __init__(self, progress: _CorridorProgress, file_index: int):
+        self.progress = progress
+        self.file_index = file_index
+
+    def put(self, item) -> None:
+        if isinstance(item, tuple) and item[0] == "UPDATE_PROGRESS":
+            self.progress.update(self.file_index, item[1])
+        else:
+            self.progress.queue.put(item)
+
 
 def select_las_files_for_corridor(
     las_files_list: List[Path],
@@ -58,48 +117,51 @@ def select_las_files_for_corridor(
     total_files = len(las_files_list)
     logging.info(f"Files to check: {total_files}")
 
+    # Header bounds and CRS come from the per-directory cache; only new or
+    # changed files are opened
+    bbox_index = load_or_build_index(las_files_list)
+
+    # Build the corridor's edge index once instead of per tested file
+    prepared_corridor = prep(corridor_polygon)
+
     for idx, las_file_path in enumerate(las_files_list, start=1):
         logging.info(f"Checking {idx}/{total_files}: {las_file_path.name}")
+        entry = bbox_index.get(las_file_path)
+        if entry is None:
+            continue
         try:
-            with laspy.open(las_file_path) as las:
-                las_crs = las.header.parse_crs()
-                if las_crs is None:
-                    if default_las_crs is not None:
-                        logging.warning(
-                            f"No CRS found in {las_file_path}. Using default EPSG:{default_las_crs.to_epsg()}."
-                        )
-                        las_crs = default_las_crs
-                    else:
-                        logging.error(
-                            f"No CRS in {las_file_path} and no default provided. Skipping."
-                        )
-                        continue
-
-                # Get bounding box of the LAS file
-                min_x, min_y, _ = las.header.min
-                max_x, max_y, _ = las.header.max
-                las_bounds = box(min_x, min_y, max_x, max_y)
-
-                # Transform bounding box if needed
-                if not las_crs.equals(corridor_crs):
-                    transformer = Transformer.from_crs(
-                        las_crs, corridor_crs, always_xy=True
+            min_x, min_y, max_x, max_y, crs_wkt = entry
+            las_crs = crs_from_wkt(crs_wkt)
+            if las_crs is None:
+                if default_las_crs is not None:
+                    logging.warning(
+                        f"No CRS found in {las_file_path}. Using default EPSG:{default_las_crs.to_epsg()}."
                     )
-                    corners = [
-                        (min_x, min_y),
-                        (min_x, max_y),
-                        (max_x, min_y),
-                        (max_x, max_y),
-                    ]
-                    transformed = [transformer.transform(xc, yc) for xc, yc in corners]
-                    xs, ys = zip(*transformed)
-                    las_bounds = box(min(xs), min(ys), max(xs), max(ys))
-
-                if las_bounds.intersects(corridor_polygon):
-                    selected_files.append(las_file_path)
-                    logging.info(f"Selected: {las_file_path.name}")
+                    las_crs = default_las_crs
                 else:
-                    logging.info(f"No intersection for {las_file_path.name}")
+                    logging.error(
+                        f"No CRS in {las_file_path} and no default provided. Skipping."
+                    )
+                    continue
+
+            # Get bounding box of the LAS file
+            las_bounds = box(min_x, min_y, max_x, max_y)
+
+            # Transform bounding box if needed
+            if not las_crs.equals(corridor_crs):
+                transformer = get_transformer(las_crs, corridor_crs)
+                # All four corners in one PROJ call
+                xs, ys = transformer.transform(
+                    np.array([min_x, min_x, max_x, max_x]),
+                    np.array([min_y, max_y, min_y, max_y]),
+                )
+                las_bounds = box(xs.min(), ys.min(), xs.max(), ys.max())
+
+            if prepared_corridor.intersects(las_bounds):
+                selected_files.append(las_file_path)
+                logging.info(f"Selected: {las_file_path.name}")
+            else:
+                logging.info(f"No intersection for {las_file_path.name}")
         except Exception as exc:
             logging.error(f"Error reading {las_file_path.name}: {exc}")
             continue
@@ -107,6 +169,140 @@ def select_las_files_for_corridor(
     return selected_files
 
 
+def order_files_along_corridor(
+    las_files: List[Path],
+    x_start: float,
+    y_start: float,
+    x_end: float,
+    y_end: float,
+    corridor_crs: CRS,
+    default_las_crs: Optional[CRS] = None,
+) -> List[Path]:
+    """
+    Sort files by the projection of their tile centre onto the corridor axis.
+
+    Args:
+        las_files: The LAS file paths to order.
+        x_start, y_start, x_end, y_end: Corridor line segment in corridor_crs.
+        corridor_crs: The CRS of the corridor.
+        default_las_crs: Default CRS if LAS files lack CRS info.
+
+    Returns:
+        The files ordered from the corridor start to its end; files without a
+        usable bounding box keep their relative order at the end.
+    """
+    dx = x_end - x_start
+    dy = y_end - y_start
+    length_sq = dx * dx + dy * dy
+    if length_sq == 0 or len(las_files) < 2:
+        return las_files
+
+    bbox_index = load_or_build_index(las_files)
+    position: Dict[Path, float] = {}
+    for las_file_path in las_files:
+        entry = bbox_index.get(las_file_path)
+        if entry is None:
+            continue
+        min_x, min_y, max_x, max_y, crs_wkt = entry
+        center_x = (min_x + max_x) / 2
+        center_y = (min_y + max_y) / 2
+        las_crs = crs_from_wkt(crs_wkt) or default_las_crs
+        if las_crs is None:
+            continue
+        if not las_crs.equals(corridor_crs):
+            transformer = get_transformer(las_crs, corridor_crs)
+            center_x, center_y = transformer.transform(center_x, center_y)
+        position[las_file_path] = (
+            (center_x - x_start) * dx + (center_y - y_start) * dy
+        ) / length_sq
+
+    return sorted(las_files, key=lambda f: position.get(f, math.inf))
+
+
+def iter_chunks_in_polygon(
+    reader: laspy.LasReader,
+    polygon: Polygon,
+    chunk_size: int = 1_000_000,
+    cancel_event: Optional[threading.Event] = None,
+    on_skip: Optional[Callable[[int], None]] = None,
+) -> Iterator[Tuple[int, laspy.ScaleAwarePointRecord]]:
+    """
+    Iterate over the chunks of an open LAS file, yielding only those whose XY extent
+    intersects the polygon's bounding box. The extent check runs on the raw int32
+    X/Y values, so chunks that are skipped are never scaled to floats.
+
+    Every chunk is still read and decoded by chunk_iterator (LAS has no spatial
+    index to seek with); skipping only saves the scaling and point-in-polygon work.
+
+    Args:
+        reader: The open LAS reader.
+        polygon: Polygon in the LAS file's CRS.
+        chunk_size: Number of points per chunk.
+        cancel_event: Stops the iteration once set, including during long runs of
+            skipped chunks.
+        on_skip: Called with the running points_read for every skipped chunk, so
+            progress keeps advancing through stretches outside the polygon.
+
+    Yields:
+        (points_read, chunk), where points_read counts every point consumed so far,
+        including the points of skipped chunks.
+    """
+    min_x, min_y, max_x, max_y = polygon.bounds
+    scale_x, scale_y, _ = reader.header.scales
+    offset_x, offset_y, _ = reader.header.offsets
+    # Polygon bounding box expressed in the file's integer coordinate space
+    int_min_x, int_max_x = (min_x - offset_x) / scale_x, (max_x - offset_x) / scale_x
+    int_min_y, int_max_y = (min_y - offset_y) / scale_y, (max_y - offset_y) / scale_y
+
+    points_read = 0
+    for chunk in reader.chunk_iterator(chunk_size):
+        if cancel_event and cancel_event.is_set():
+            return
+        points_read += len(chunk)
+        raw_x = chunk.X
+        raw_y = chunk.Y
+        if (
+            raw_x.max() < int_min_x
+            or raw_x.min() > int_max_x
+            or raw_y.max() < int_min_y
+            or raw_y.min() > int_max_y
+        ):
+            if on_skip:
+                on_skip(points_read)
+            continue
+        yield points_read, chunk
+
+
+def _quantize(
+    values: np.ndarray, offset: float, scale: float, out: np.ndarray
+) -> None:
+    """
+    Convert scaled coordinates to integer LAS coordinates, in place in `values`.
+
+    Args:
+        values: Float64 scaled coordinates (overwritten).
+        offset: Output header offset for the axis.
+        scale: Output header scale for the axis.
+        out: The int32 record field receiving the rounded values.
+
+    Raises:
+        OverflowError: If a value does not fit the output's int32 range.
+    """
+    np.subtract(values, offset, out=values)
+    np.divide(values, scale, out=values)
+    np.rint(values, out=values)
+    # The float -> int32 cast wraps silently, so check the range first
+    if values.size:
+        limits = np.iinfo(out.dtype)
+        low, high = values.min(), values.max()
+        if not (limits.min <= low and high <= limits.max):
+            raise OverflowError(
+                f"Coordinates [{low * scale + offset}, {high * scale + offset}] "
+                f"do not fit the output scale {scale} and offset {offset}"
+            )
+    out[:] = values
+
+
 def process_las_file(
     las_file_path: Path,
     corridor_polygon: Polygon,
@@ -118,6 +314,7 @@ def process_las_file(
     file_number: Optional[int] = None,
     total_files: Optional[int] = None,
     default_las_crs: Optional[CRS] = None,
+    write_buffer_points: int = _WRITE_BUFFER_POINTS,
 ) -> Optional[Dict[str, float]]:
     """
     Process a single LAS file: filter by corridor polygon, transform coords, downsample, write output.
@@ -133,6 +330,8 @@ def process_las_file(
         file_number: Current file index being processed.
         total_files: Total number of files to process.
         default_las_crs: Default CRS if input LAS lacks CRS.
+        write_buffer_points: Filtered records to batch per write; never less than
+            one chunk.
 
     Returns:
         A dictionary of stats if successful, else None.
@@ -154,11 +353,15 @@ def process_las_file(
     }
 
     start_time = time.time()
-    inspection_report = inspect_las_file(las_file_path)
-    logging.info(inspection_report)
+
+    # The full classification analysis reads every point, so it is debug-only
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug(inspect_las_file(las_file_path))
 
     try:
         with laspy.open(las_file_path) as inlas:
+            if logging.getLogger().isEnabledFor(logging.INFO):
+                logging.info(inspect_las_header(inlas.header, las_file_path))
             las_crs = inlas.header.parse_crs()
             if las_crs is None:
                 if default_las_crs:
@@ -178,66 +381,146 @@ def process_las_file(
             )
             transformer_to_corridor_crs = None
             if not las_crs.equals(corridor_crs):
-                transformer_to_corridor_crs = Transformer.from_crs(
-                    las_crs, corridor_crs, always_xy=True
-                )
+                transformer_to_corridor_crs = get_transformer(las_crs, corridor_crs)
 
             total_points = inlas.header.point_count
             file_stats["total_points"] = total_points
 
             chunk_size = 1_000_000
             last_logged_progress = -1
+            last_sent_progress = -1
+            corridor_bounds = corridor_in_las_crs.bounds
+            # Header values are read once; the loop works on the raw record array
+            scales = np.asarray(inlas.header.scales, dtype=np.float64)
+            offsets = np.asarray(inlas.header.offsets, dtype=np.float64)
+            point_format = inlas.header.point_format
+
+            # Scaled coordinates for the corridor test, reused across chunks
+            x_scaled = np.empty(chunk_size, dtype=np.float64)
+            y_scaled = np.empty_like(x_scaled)
+            in_corridor_buf = np.empty(chunk_size, dtype=bool)
+
+            # Records are written raw, so coordinates must already sit on the
+            # output grid; only axes whose scale/offset differ are requantized
+            out_scales = writer.header.scales
+            out_offsets = writer.header.offsets
+            on_grid = (scales == out_scales) & (offsets == out_offsets)
+            requantize_xy = transformer_to_corridor_crs is not None or not (
+                on_grid[0] and on_grid[1]
+            )
 
-            for point_chunk in inlas.chunk_iterator(chunk_size):
-                if cancel_event and cancel_event.is_set():
-                    logging.info(f"Canceled processing {las_file_path.name}")
-                    return None
+            # Reused across chunks as the in-place target of the CRS transform
+            if requantize_xy or not on_grid[2]:
+                x_buf = np.empty(chunk_size, dtype=np.float64)
+                y_buf = np.empty_like(x_buf)
+
+            # Filtered records are batched before reaching the shared writer
+            write_buf_size = max(
+                1, min(max(write_buffer_points, chunk_size), total_points)
+            )
+            write_buf: Optional[np.ndarray] = None
+            write_fill = 0
+
+            def report_progress(points_read: int) -> None:
+                nonlocal last_sent_progress, last_logged_progress
+                file_stats["points_processed"] = points_read
+                # Update progress in 10% increments or custom intervals
+                progress = int((points_read / total_points) * 100)
+                # Only wake the GUI when the displayed percentage actually changes
+                if queue_obj and progress != last_sent_progress:
+                    queue_obj.put(("UPDATE_PROGRESS", progress))
+                    last_sent_progress = progress
+                if progress >= last_logged_progress + 10:
+                    logging.info(
+                        f"File {file_number}/{total_files} "
+                        f"({las_file_path.name}) - {progress}% complete"
+                    )
+                    last_logged_progress = progress
 
-                x = point_chunk.x
-                y = point_chunk.y
+            # Chunks entirely outside the corridor's bbox are skipped unscaled,
+            # but still count towards progress
+            for points_read, point_chunk in iter_chunks_in_polygon(
+                inlas,
+                corridor_in_las_crs,
+                chunk_size,
+                cancel_event,
+                on_skip=report_progress,
+            ):
+                raw = point_chunk.array
+                n = len(raw)
+                x = x_scaled[:n]
+                y = y_scaled[:n]
+                np.multiply(raw["X"], scales[0], out=x)
+                np.add(x, offsets[0], out=x)
+                np.multiply(raw["Y"], scales[1], out=y)
+                np.add(y, offsets[1], out=y)
 
                 # Determine which points are within the corridor
-                in_corridor = points_in_polygon_chunk(x, y, corridor_in_las_crs)
-                num_points_chunk = len(point_chunk)
-                num_points_corridor = np.sum(in_corridor)
+                in_corridor = points_in_polygon_chunk(
+                    x,
+                    y,
+                    corridor_in_las_crs,
+                    bounds=corridor_bounds,
+                    out=in_corridor_buf[:n],
+                )
+                num_points_corridor = np.count_nonzero(in_corridor)
 
-                file_stats["points_processed"] += num_points_chunk
                 file_stats["points_within_corridor"] += num_points_corridor
 
                 if num_points_corridor > 0:
-                    filtered_chunk = point_chunk[in_corridor]
-                    # Downsampling
+                    # Mask and downsample with a single gather of the point records
+                    kept = np.flatnonzero(in_corridor)
                     if nth_point > 1:
-                        indices = np.arange(0, len(filtered_chunk), nth_point)
-                        filtered_chunk = filtered_chunk[indices]
-
-                    # Transform coordinates if needed
-                    if transformer_to_corridor_crs:
-                        x_coords = filtered_chunk.x
-                        y_coords = filtered_chunk.y
-                        z_coords = filtered_chunk.z
-                        x_trans, y_trans = transformer_to_corridor_crs.transform(
-                            x_coords, y_coords
+                        kept = kept[::nth_point]
+                    records = raw[kept]
+                    num_kept = len(records)
+
+                    # Transform coordinates if needed, reusing the scaled x/y
+                    if requantize_xy:
+                        x_trans = x_buf[:num_kept]
+                        y_trans = y_buf[:num_kept]
+                        np.take(x, kept, out=x_trans)
+                        np.take(y, kept, out=y_trans)
+                        if transformer_to_corridor_crs:
+                            transformer_to_corridor_crs.transform(
+                                x_trans, y_trans, inplace=True
+                            )
+                        _quantize(x_trans, out_offsets[0], out_scales[0], records["X"])
+                        _quantize(y_trans, out_offsets[1], out_scales[1], records["Y"])
+                    # Z is untouched by a horizontal transform
+                    if not on_grid[2]:
+                        z_values = x_buf[:num_kept]
+                        np.multiply(records["Z"], scales[2], out=z_values)
+                        np.add(z_values, offsets[2], out=z_values)
+                        _quantize(z_values, out_offsets[2], out_scales[2], records["Z"])
+
+                    # Accumulate records; the writer is only called once per full buffer
+                    if write_buf is None:
+                        write_buf = np.empty(write_buf_size, dtype=records.dtype)
+                    if write_fill + num_kept > write_buf_size:
+                        writer.write_points(
+                            laspy.PackedPointRecord(
+                                write_buf[:write_fill], point_format
+                            )
                         )
-                        filtered_chunk.x = x_trans
-                        filtered_chunk.y = y_trans
-                        filtered_chunk.z = z_coords
+                        write_fill = 0
+                    write_buf[write_fill : write_fill + num_kept] = records
+                    write_fill += num_kept
+                    file_stats["points_written"] += num_kept
 
-                    # Write to the shared output writer
-                    writer.write_points(filtered_chunk)
-                    file_stats["points_written"] += len(filtered_chunk)
+                report_progress(points_read)
 
-                # Update progress in 10% increments or custom intervals
-                progress = int((file_stats["points_processed"] / total_points) * 100)
-                if queue_obj:
-                    queue_obj.put(("UPDATE_PROGRESS", progress))
-                if progress >= last_logged_progress + 10:
-                    logging.info(
-                        f"File {file_number}/{total_files} "
-                        f"({las_file_path.name}) - {progress}% complete"
-                    )
-                    last_logged_progress = progress
+            # The iterator stops early once cancellation is requested
+            if cancel_event and cancel_event.is_set():
+                logging.info(f"Canceled processing {las_file_path.name}")
+                return None
 
+            if write_fill:
+                writer.write_points(
+                    laspy.PackedPointRecord(write_buf[:write_fill], point_format)
+                )
+
+            file_stats["points_processed"] = total_points
             file_stats["processing_time"] = time.time() - start_time
             completion_msg = (
                 f"Completed file {file_number} of {total_files} ({las_file_path.name}): "
@@ -269,6 +552,7 @@ def process_corridor(
     queue_obj: Optional[queue.Queue] = None,
     corridor_epsg_code: Optional[int] = None,
     default_las_epsg_code: Optional[int] = None,
+    link_downloads: bool = False,
 ) -> bool:
     """
     Main function to process a corridor:
@@ -291,6 +575,10 @@ def process_corridor(
         queue_obj: Queue for GUI progress updates.
         corridor_epsg_code: Corridor EPSG code.
         default_las_epsg_code: Default LAS EPSG code if missing.
+        link_downloads: In download mode, hardlink files instead of copying them
+            when the network directory is on the same filesystem. The local tile
+            then shares its data with the network one, so edits to either affect
+            both.
 
     Returns:
         True if processing succeeded and points were written, else False.
@@ -318,8 +606,11 @@ def process_corridor(
             x_start, y_start, x_end, y_end, corridor_half_width
         )
         corridor_length = math.hypot(x_end - x_start, y_end - y_start)
+        # The rectangle extends half a width past each end of the segment
+        corridor_width = corridor_half_width * 2
+        corridor_area = (corridor_length + corridor_width) * corridor_width
         logging.info(
-            f"\nCorridor Stats: Area={corridor_polygon.area:.2f}m² "
+            f"\nCorridor Stats: Area={corridor_area:.2f}m² "
             f"Length={corridor_length:.2f}m Width={corridor_half_width*2:.2f}m"
         )
 
@@ -339,14 +630,17 @@ def process_corridor(
                 logging.error("Network directory not specified.")
                 return False
             source_las_files = get_las_files_from_directory(source_dir_path)
-            network_las_files = get_las_files_from_directory(network_dir_path)
-
-            network_files_by_name = {f.name: f for f in network_las_files}
-            file_dict = {f.name: f for f in source_las_files}
-            for f in network_las_files:
-                if f.name not in file_dict:
-                    file_dict[f.name] = f
-            all_las_files = list(file_dict.values())
+            # Scanned once; reused below to pick the files to download
+            network_files_by_name = {
+                f.name: f for f in get_las_files_from_directory(network_dir_path)
+            }
+            # Local copies take precedence over network files of the same name
+            all_las_files = list(
+                {
+                    **network_files_by_name,
+                    **{f.name: f for f in source_las_files},
+                }.values()
+            )
         else:
             logging.error(f"Invalid source_option: {source_option}")
             return False
@@ -365,9 +659,6 @@ def process_corridor(
 
         # If we are in "download" mode, attempt to download any missing files
         if source_option == 3 and network_dir_path:
-            network_files_by_name = {
-                f.name: f for f in get_las_files_from_directory(network_dir_path)
-            }
             files_to_download = [
                 vf.name for vf in valid_files if vf.name in network_files_by_name
             ]
@@ -377,7 +668,10 @@ def process_corridor(
                     network_files_by_name[name] for name in files_to_download
                 ]
                 downloaded_files, skipped_files, failed_files = download_required_files(
-                    network_files_needed, network_dir_path, source_dir_path
+                    network_files_needed,
+                    network_dir_path,
+                    source_dir_path,
+                    link_if_possible=link_downloads,
                 )
 
                 # Replace references with local paths if downloaded
@@ -396,6 +690,18 @@ def process_corridor(
                 logging.error("No valid local files found after download attempts.")
                 return False
 
+        # Visit tiles in order along the corridor so neighbouring tiles are read
+        # one after another
+        valid_files = order_files_along_corridor(
+            valid_files,
+            x_start,
+            y_start,
+            x_end,
+            y_end,
+            corridor_crs,
+            default_las_crs,
+        )
+
         # Prepare an output LAS writer
         output_path = Path(output_file_path).resolve()
         output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -413,32 +719,95 @@ def process_corridor(
         total_points_processed = 0
         total_points_written = 0
         processing_stats = []
+        total_files = len(valid_files)
+
+        # Files are I/O, NumPy and PROJ bound (all release the GIL), so threads scale
+        max_workers = min(os.cpu_count() or 1, total_files, _MAX_FILE_WORKERS)
+        # Keep the write buffers of all workers within one overall budget
+        write_buffer_points = _WRITE_BUFFER_POINTS // max_workers
+
+        # One progress bar for the whole corridor instead of one sweep per file
+        progress = (
+            _CorridorProgress(queue_obj, [f.stat().st_size for f in valid_files])
+            if queue_obj
+            else None
+        )
+
+        def run_file(
+            idx: int, file_path: Path, target_writer: laspy.LasWriter
+        ) -> Optional[Dict[str, float]]:
+            if cancel_event and cancel_event.is_set():
+                return None
+            return process_las_file(
+                file_path,
+                corridor_polygon,
+                corridor_crs,
+                target_writer,
+                nth_point,
+                cancel_event,
+                progress.for_file(idx - 1) if progress else None,
+                file_number=idx,
+                total_files=total_files,
+                default_las_crs=default_las_crs,
+                write_buffer_points=write_buffer_points,
+            )
+
+        def run_file_to_part(idx: int, file_path: Path) -> Optional[Dict[str, float]]:
+            # Each worker writes its own part file; parts are merged in file order
+            with laspy.open(part_paths[idx], mode="w", header=header) as part_writer:
+                return run_file(idx, file_path, part_writer)
+
+        part_paths = {
+            idx: output_path.with_suffix(f".part{idx}.las")
+            for idx in range(1, total_files + 1)
+        }
 
         # Open output in "write" mode
         with laspy.open(output_path, mode="w", header=header) as writer:
-            # Process each file in a loop
-            for idx, file_path in enumerate(valid_files, start=1):
-                if cancel_event and cancel_event.is_set():
-                    logging.info("Processing canceled by user.")
-                    break
-                stats = process_las_file(
-                    file_path,
-                    corridor_polygon,
-                    corridor_crs,
-                    writer,
-                    nth_point,
-                    cancel_event,
-                    queue_obj,
-                    file_number=idx,
-                    total_files=len(valid_files),
-                    default_las_crs=default_las_crs,
+            if max_workers == 1:
+                results = (
+                    (file_path, run_file(idx, file_path, writer))
+                    for idx, file_path in enumerate(valid_files, start=1)
                 )
-                if stats is None:
-                    logging.warning(f"Skipping file {file_path.name} due to errors.")
-                    continue
-                total_points_processed += stats["points_processed"]
-                total_points_written += stats["points_written"]
-                processing_stats.append(stats)
+            else:
+                executor = ThreadPoolExecutor(max_workers=max_workers)
+                futures = [
+                    executor.submit(run_file_to_part, idx, file_path)
+                    for idx, file_path in enumerate(valid_files, start=1)
+                ]
+                results = (
+                    (file_path, future.result())
+                    for file_path, future in zip(valid_files, futures)
+                )
+
+            try:
+                for idx, (file_path, stats) in enumerate(results, start=1):
+                    if cancel_event and cancel_event.is_set():
+                        logging.info("Processing canceled by user.")
+                        break
+                    if progress:
+                        # Skipped files count as done too
+                        progress.update(idx - 1, 100)
+                    if stats is None:
+                        logging.warning(f"Skipping file {file_path.name} due to errors.")
+                        continue
+                    if max_workers > 1:
+                        with laspy.open(part_paths[idx]) as part:
+                            # Parts share the output header, so records copy as is
+                            for part_chunk in part.chunk_iterator(1_000_000):
+                                writer.write_points(
+                                    laspy.PackedPointRecord(
+                                        part_chunk.array, part_chunk.point_format
+                                    )
+                                )
+                    total_points_processed += stats["points_processed"]
+                    total_points_written += stats["points_written"]
+                    processing_stats.append(stats)
+            finally:
+                if max_workers > 1:
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    for part_path in part_paths.values():
+                        part_path.unlink(missing_ok=True)
 
         # Summaries
         if not (cancel_event and cancel_event.is_set()):
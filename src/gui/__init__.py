@@ -7,4 +7,3 @@ GUI modules for LAS corridor processing, using Tkinter for user interactions.
 # Optionally re-export main classes:
 from .main_window import Application
 from .logging_handler import QueueHandler
-from .widgets import ExampleCustomWidget  # or any other widget
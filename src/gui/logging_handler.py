@@ -6,17 +6,95 @@ so they can be displayed or handled by the GUI.
 """
 
 import logging
+import logging.handlers
+import time
+from typing import List, Optional
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that renders the date/time part of %(asctime)s only once per second;
+    records within the same second reuse it and just append their milliseconds.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_second: Optional[int] = None
+        self._cached_time = ""
+
+    def formatTime(self, record: logging.LogRecord, datefmt=None) -> str:
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_time = time.strftime(
+                self.default_time_format, self.converter(second)
+            )
+            self._cached_second = second
+        return self.default_msec_format % (self._cached_time, record.msecs)
 
 
 class QueueHandler(logging.Handler):
     """
     A custom logging handler that places log records into a GUI queue.
+
+    Formatted records are buffered and put on the queue as a single list once
+    `max_batch` entries accumulate or `flush_interval` seconds pass, so bursts of
+    logging cost one queue put instead of one per record. WARNING and above
+    flush immediately to keep their latency low.
     """
 
-    def __init__(self, queue_obj):
+    def __init__(
+        self, queue_obj, max_batch: int = 32, flush_interval: float = 0.05
+    ):
         super().__init__()
         self.queue = queue_obj
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self._buffer: List[str] = []
+        self._first_buffered = 0.0
 
     def emit(self, record: logging.LogRecord) -> None:
         log_entry = self.format(record)
-        self.queue.put(log_entry)
+        with self.lock:
+            if not self._buffer:
+                self._first_buffered = time.monotonic()
+            self._buffer.append(log_entry)
+            if (
+                record.levelno >= logging.WARNING
+                or len(self._buffer) >= self.max_batch
+                or time.monotonic() - self._first_buffered >= self.flush_interval
+            ):
+                self._flush_locked()
+
+    def flush(self) -> None:
+        """
+        Put any buffered entries on the queue; the GUI calls this when polling.
+        """
+        with self.lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if self._buffer:
+            self.queue.put(self._buffer)
+            self._buffer = []
+
+
+class GuiQueueListener(logging.handlers.QueueListener):
+    """
+    QueueListener feeding a QueueHandler that also forwards plain control messages
+    (such as "PROCESSING_COMPLETE") put on the same log queue. A message reaches
+    the GUI queue after every record logged before it, with the handler's pending
+    batch flushed first.
+    """
+
+    def __init__(self, log_queue, handler: QueueHandler, **kwargs):
+        super().__init__(log_queue, handler, **kwargs)
+        self.gui_handler = handler
+
+    def handle(self, record) -> None:
+        if isinstance(record, logging.LogRecord):
+            super().handle(record)
+            return
+        self.gui_handler.flush()
+        self.gui_handler.queue.put(record)
@@ -6,28 +6,92 @@ including all widget layout, user input handling, and thread-based orchestration
 """
 
 import logging
-import math
-import os
+import logging.handlers
 import platform
 import queue
 import subprocess
 import threading
 import time
 import tkinter as tk
+from collections import deque
 from tkinter import filedialog, messagebox, scrolledtext
 from tkinter import ttk
 from pathlib import Path
-from typing import List, Optional
+from typing import Deque, List, Optional
 
-# Assuming these are in your repo under src/core and src/utils
-# Adjust relative imports to match your package structure
-from ..core.file_operations import download_files_from_network, convert_las_to_txt
-from ..core.file_operations import convert_las_to_txt
-from ..core.processing import process_corridor
+# Core processing (laspy, numpy, pyproj, shapely) is imported lazily in
+# run_processing so the window opens without loading it
 from ..utils.validators import validate_inputs, validate_epsg_code
 
 # Import the custom QueueHandler defined in logging_handler.py
-from .logging_handler import QueueHandler
+from .logging_handler import CachedTimeFormatter, GuiQueueListener, QueueHandler
+
+# Host OS, looked up once for open_path
+_PLATFORM = platform.system()
+
+# Upper bound on GUI queue messages handled per poll, so the UI stays responsive
+MAX_MESSAGES_PER_POLL = 256
+# Poll delays while a backlog remains and as a fallback when idle
+POLL_BUSY_MS = 20
+POLL_IDLE_MS = 250
+# Most recent log lines kept for save_log
+MAX_LOG_MESSAGES = 100_000
+
+# Labelled entries: (frame, attribute, label, row, label column, width, default)
+ENTRY_LAYOUT = (
+    ("coords", "x_start_entry", "Start X:", 0, 0, 15, None),
+    ("coords", "y_start_entry", "Start Y:", 0, 2, 15, None),
+    ("coords", "x_end_entry", "End X:", 1, 0, 15, None),
+    ("coords", "y_end_entry", "End Y:", 1, 2, 15, None),
+    ("crs", "corridor_crs_entry", "Corridor CRS EPSG Code:", 0, 0, 15, "25832"),
+    ("crs", "default_las_crs_entry", "Default LAS CRS EPSG Code:", 1, 0, 15, "25832"),
+    ("corridor", "buffer_entry", "Corridor half-width (m):", 0, 0, 20, "80"),
+    ("corridor", "nth_point_entry", "Point sampling rate (nth point):", 1, 0, 20, "10"),
+)
+
+# Path rows: (attribute, label, row, browse method, open method, default)
+PATH_LAYOUT = (
+    (
+        "source_dir_entry",
+        "Local source directory:",
+        0,
+        "browse_source_dir",
+        "open_source_dir",
+        r"C:\LAS-Files",
+    ),
+    (
+        "network_dir_entry",
+        "Network source directory:",
+        1,
+        "browse_network_dir",
+        "open_network_dir",
+        r"\\ATNAS103\Berichte\2022-06_ARCADIS_EAP_B\2_ALS-Daten\B",
+    ),
+    (
+        "output_file_entry",
+        "Output file path:",
+        2,
+        "browse_output_file",
+        "open_output_file",
+        "corridor_output.las",
+    ),
+)
+
+
+class SignalingQueue(deque):
+    """
+    Message queue between worker threads and the GUI: a deque (append/popleft are
+    atomic, so no lock is taken) plus an `arrived` event set on every put, so a
+    waiting thread can wake the GUI. Producers only use `put`.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.arrived = threading.Event()
+
+    def put(self, item) -> None:
+        self.append(item)
+        self.arrived.set()
 
 
 class Application(tk.Tk):
@@ -42,11 +106,16 @@ class Application(tk.Tk):
         self.title("LAS Corridor Processing by VoNa")
         self.style = ttk.Style(self)
         self.style.theme_use("clam")
-        self.queue = queue.Queue()
-        self.messages: List[str] = []
+        self.queue = SignalingQueue()
+        # Bounded so long verbose runs cannot grow memory without limit
+        self.messages: Deque[str] = deque(maxlen=MAX_LOG_MESSAGES)
         self.processing_thread: Optional[threading.Thread] = None
         self.cancel_event = threading.Event()
         self.close_requested = False
+        self.processing_running = False
+        self.poll_after_id: Optional[str] = None
+        self.closing = False
+        self.see_pending = False
 
         # GUI element creation
         self.create_widgets()
@@ -55,6 +124,11 @@ class Application(tk.Tk):
         # Logging a startup message
         logging.info("Application started.")
 
+        # Messages wake the GUI through a virtual event; polling is a fallback
+        self.bind("<<LogArrived>>", lambda event: self.process_queue())
+        self.after_idle(self.start_queue_bridge)
+        self.process_queue()
+
         # Handle window close event
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
 
@@ -76,38 +150,9 @@ class Application(tk.Tk):
         coords_frame = ttk.Frame(coord_frame)
         coords_frame.grid(row=0, column=0, columnspan=2, sticky="w", padx=(5, 20))
 
-        ttk.Label(coords_frame, text="Start X:").grid(row=0, column=0, sticky="e")
-        self.x_start_entry = ttk.Entry(coords_frame, width=15)
-        self.x_start_entry.grid(row=0, column=1, padx=5, pady=5)
-
-        ttk.Label(coords_frame, text="Start Y:").grid(row=0, column=2, sticky="e")
-        self.y_start_entry = ttk.Entry(coords_frame, width=15)
-        self.y_start_entry.grid(row=0, column=3, padx=5, pady=5)
-
-        ttk.Label(coords_frame, text="End X:").grid(row=1, column=0, sticky="e")
-        self.x_end_entry = ttk.Entry(coords_frame, width=15)
-        self.x_end_entry.grid(row=1, column=1, padx=5, pady=5)
-
-        ttk.Label(coords_frame, text="End Y:").grid(row=1, column=2, sticky="e")
-        self.y_end_entry = ttk.Entry(coords_frame, width=15)
-        self.y_end_entry.grid(row=1, column=3, padx=5, pady=5)
-
         # Corridor CRS
         crs_frame = ttk.Frame(coord_frame)
         crs_frame.grid(row=0, column=2, columnspan=2, sticky="e", padx=5)
-        ttk.Label(crs_frame, text="Corridor CRS EPSG Code:").grid(
-            row=0, column=0, sticky="e"
-        )
-        self.corridor_crs_entry = ttk.Entry(crs_frame, width=15)
-        self.corridor_crs_entry.grid(row=0, column=1, padx=5, pady=5)
-        self.corridor_crs_entry.insert(0, "25832")
-
-        ttk.Label(crs_frame, text="Default LAS CRS EPSG Code:").grid(
-            row=1, column=0, sticky="e"
-        )
-        self.default_las_crs_entry = ttk.Entry(crs_frame, width=15)
-        self.default_las_crs_entry.grid(row=1, column=1, padx=5, pady=5)
-        self.default_las_crs_entry.insert(0, "25832")
 
         # Corridor settings
         corridor_frame = ttk.LabelFrame(
@@ -115,73 +160,38 @@ class Application(tk.Tk):
         )
         corridor_frame.grid(row=1, column=0, sticky=tk.EW, pady=10)
 
-        ttk.Label(corridor_frame, text="Corridor half-width (m):").grid(
-            row=0, column=0, sticky="e"
-        )
-        self.buffer_entry = ttk.Entry(corridor_frame, width=20)
-        self.buffer_entry.grid(row=0, column=1, padx=5, pady=5)
-        self.buffer_entry.insert(0, "80")
-
-        ttk.Label(corridor_frame, text="Point sampling rate (nth point):").grid(
-            row=1, column=0, sticky="e"
-        )
-        self.nth_point_entry = ttk.Entry(corridor_frame, width=20)
-        self.nth_point_entry.grid(row=1, column=1, padx=5, pady=5)
-        self.nth_point_entry.insert(0, "10")
+        # Labelled entries, created from ENTRY_LAYOUT
+        frames = {"coords": coords_frame, "crs": crs_frame, "corridor": corridor_frame}
+        label_cls, entry_cls = ttk.Label, ttk.Entry
+        for frame_key, attr, text, row, column, width, default in ENTRY_LAYOUT:
+            parent = frames[frame_key]
+            label_cls(parent, text=text).grid(row=row, column=column, sticky="e")
+            entry = entry_cls(parent, width=width)
+            entry.grid(row=row, column=column + 1, padx=5, pady=5)
+            if default is not None:
+                entry.insert(0, default)
+            setattr(self, attr, entry)
 
         # Paths
         path_frame = ttk.LabelFrame(main_frame, text="Paths", padding="5 5 5 5")
         path_frame.grid(row=2, column=0, sticky=tk.EW)
         path_frame.columnconfigure(1, weight=1)
 
-        ttk.Label(path_frame, text="Local source directory:").grid(
-            row=0, column=0, sticky="e"
-        )
-        self.source_dir_entry = ttk.Entry(path_frame)
-        self.source_dir_entry.grid(row=0, column=1, padx=5, pady=5, sticky=tk.EW)
-        source_buttons_frame = ttk.Frame(path_frame)
-        source_buttons_frame.grid(row=0, column=2, sticky="e")
-        ttk.Button(
-            source_buttons_frame, text="Browse...", command=self.browse_source_dir
-        ).pack(side=tk.LEFT, padx=2)
-        ttk.Button(
-            source_buttons_frame, text="Open", command=self.open_source_dir
-        ).pack(side=tk.LEFT, padx=2)
-
-        ttk.Label(path_frame, text="Network source directory:").grid(
-            row=1, column=0, sticky="e"
-        )
-        self.network_dir_entry = ttk.Entry(path_frame)
-        self.network_dir_entry.grid(row=1, column=1, padx=5, pady=5, sticky=tk.EW)
-        network_buttons_frame = ttk.Frame(path_frame)
-        network_buttons_frame.grid(row=1, column=2, sticky="e")
-        ttk.Button(
-            network_buttons_frame, text="Browse...", command=self.browse_network_dir
-        ).pack(side=tk.LEFT, padx=2)
-        ttk.Button(
-            network_buttons_frame, text="Open", command=self.open_network_dir
-        ).pack(side=tk.LEFT, padx=2)
-
-        ttk.Label(path_frame, text="Output file path:").grid(
-            row=2, column=0, sticky="e"
-        )
-        self.output_file_entry = ttk.Entry(path_frame)
-        self.output_file_entry.grid(row=2, column=1, padx=5, pady=5, sticky=tk.EW)
-        output_buttons_frame = ttk.Frame(path_frame)
-        output_buttons_frame.grid(row=2, column=2, sticky="e")
-        ttk.Button(
-            output_buttons_frame, text="Browse...", command=self.browse_output_file
-        ).pack(side=tk.LEFT, padx=2)
-        ttk.Button(
-            output_buttons_frame, text="Open", command=self.open_output_file
-        ).pack(side=tk.LEFT, padx=2)
-
-        # Sample default paths
-        self.source_dir_entry.insert(0, r"C:\LAS-Files")
-        self.network_dir_entry.insert(
-            0, r"\\ATNAS103\Berichte\2022-06_ARCADIS_EAP_B\2_ALS-Daten\B"
-        )
-        self.output_file_entry.insert(0, "corridor_output.las")
+        button_cls, frame_cls, ew = ttk.Button, ttk.Frame, tk.EW
+        for attr, text, row, browse_method, open_method, default in PATH_LAYOUT:
+            label_cls(path_frame, text=text).grid(row=row, column=0, sticky="e")
+            entry = entry_cls(path_frame)
+            entry.grid(row=row, column=1, padx=5, pady=5, sticky=ew)
+            entry.insert(0, default)
+            setattr(self, attr, entry)
+            buttons_frame = frame_cls(path_frame)
+            buttons_frame.grid(row=row, column=2, sticky="e")
+            button_cls(
+                buttons_frame, text="Browse...", command=getattr(self, browse_method)
+            ).pack(side=tk.LEFT, padx=2)
+            button_cls(
+                buttons_frame, text="Open", command=getattr(self, open_method)
+            ).pack(side=tk.LEFT, padx=2)
 
         # Options
         options_frame = ttk.LabelFrame(main_frame, text="Options", padding="5 5 5 5")
@@ -218,6 +228,15 @@ class Application(tk.Tk):
         )
         self.export_txt_check.grid(row=1, column=0, sticky="w", padx=5, pady=5)
 
+        # Off by default: a hardlinked "copy" shares its data with the network file
+        self.link_downloads_var = tk.BooleanVar()
+        self.link_downloads_check = ttk.Checkbutton(
+            options_frame,
+            text="Hardlink downloaded files instead of copying (same disk only)",
+            variable=self.link_downloads_var,
+        )
+        self.link_downloads_check.grid(row=2, column=0, sticky="w", padx=5, pady=5)
+
         # Control and progress
         control_frame = ttk.LabelFrame(main_frame, text="Control", padding="5 5 5 5")
         control_frame.grid(row=4, column=0, sticky=tk.EW, pady=10)
@@ -255,26 +274,36 @@ class Application(tk.Tk):
         )
         self.save_log_button.pack(side=tk.RIGHT)
 
-    def open_path(self, path_str: str) -> None:
+    def open_path(self, path: Path) -> None:
         """
         Open a file or directory in the OS's file explorer if it exists.
         """
-        path = Path(path_str)
         if path.exists():
-            if platform.system() == "Windows":
+            # The viewer is fully detached: it inherits no handles from this process
+            # and does not outlive or block the GUI's shutdown
+            if _PLATFORM == "Windows":
                 # On Windows: open the directory or select the file
                 os_cmd = (
                     ["explorer", str(path)]
                     if path.is_dir()
                     else ["explorer", "/select,", str(path)]
                 )
-                subprocess.Popen(os_cmd)
-            elif platform.system() == "Darwin":
+                subprocess.Popen(
+                    os_cmd,
+                    close_fds=True,
+                    creationflags=subprocess.DETACHED_PROCESS
+                    | subprocess.CREATE_NEW_PROCESS_GROUP,
+                )
+            elif _PLATFORM == "Darwin":
                 # On macOS
-                subprocess.Popen(["open", str(path)])
+                subprocess.Popen(
+                    ["open", str(path)], close_fds=True, start_new_session=True
+                )
             else:
                 # Linux or others
-                subprocess.Popen(["xdg-open", str(path)])
+                subprocess.Popen(
+                    ["xdg-open", str(path)], close_fds=True, start_new_session=True
+                )
         else:
             messagebox.showerror("Error", f"Path '{path}' does not exist.")
 
@@ -282,8 +311,8 @@ class Application(tk.Tk):
         """
         Open the source directory in the file explorer if it exists.
         """
-        path = self.source_dir_entry.get().strip()
-        if Path(path).is_dir():
+        path = Path(self.source_dir_entry.get().strip())
+        if path.is_dir():
             self.open_path(path)
         else:
             messagebox.showerror("Error", f"Directory '{path}' does not exist.")
@@ -292,8 +321,8 @@ class Application(tk.Tk):
         """
         Open the network directory in the file explorer if it exists.
         """
-        path = self.network_dir_entry.get().strip()
-        if Path(path).is_dir():
+        path = Path(self.network_dir_entry.get().strip())
+        if path.is_dir():
             self.open_path(path)
         else:
             messagebox.showerror("Error", f"Directory '{path}' does not exist.")
@@ -302,12 +331,11 @@ class Application(tk.Tk):
         """
         Open the output file or its directory in the file explorer if it exists.
         """
-        file_path = self.output_file_entry.get().strip()
-        p = Path(file_path)
+        p = Path(self.output_file_entry.get().strip())
         if p.is_file():
-            self.open_path(str(p))
+            self.open_path(p)
         elif p.parent.is_dir():
-            self.open_path(str(p.parent))
+            self.open_path(p.parent)
         else:
             messagebox.showerror("Error", f"File '{p}' does not exist.")
 
@@ -363,19 +391,17 @@ class Application(tk.Tk):
             messagebox.showerror("Input Error", error_msg)
             return
 
-        corridor_epsg_code = validate_epsg_code(
-            self.corridor_crs_entry.get().strip(), "Corridor CRS"
-        )
+        corridor_epsg_code = validate_epsg_code(self.corridor_crs_entry.get().strip())
         if corridor_epsg_code is None:
+            self.show_epsg_error("Corridor CRS")
             return
 
         default_las_epsg_code = None
         default_epsg_str = self.default_las_crs_entry.get().strip()
         if default_epsg_str:
-            default_las_epsg_code = validate_epsg_code(
-                default_epsg_str, "Default LAS CRS"
-            )
+            default_las_epsg_code = validate_epsg_code(default_epsg_str)
             if default_las_epsg_code is None:
+                self.show_epsg_error("Default LAS CRS")
                 return
 
         x_start = float(x_start_str)
@@ -389,6 +415,7 @@ class Application(tk.Tk):
         output_file_path = self.output_file_entry.get().strip()
         source_option = self.source_option_var.get()
         export_txt = self.export_txt_var.get()
+        link_downloads = self.link_downloads_var.get()
         network_directory = self.network_dir_entry.get().strip()
 
         self.start_button.config(state=tk.DISABLED)
@@ -414,11 +441,21 @@ class Application(tk.Tk):
                 corridor_epsg_code,
                 default_las_epsg_code,
                 network_directory,
+                link_downloads,
             ),
         )
-        self.processing_thread.start()
-        self.after(100, self.process_queue)
         self.cancel_event.clear()
+        self.processing_running = True
+        self.processing_thread.start()
+
+    def show_epsg_error(self, field_name: str) -> None:
+        """
+        Tell the user that an EPSG code field does not hold a valid code.
+        """
+        messagebox.showerror(
+            "Input Error",
+            f"Please enter a valid EPSG code (integer) for {field_name}.",
+        )
 
     def run_processing(
         self,
@@ -435,12 +472,16 @@ class Application(tk.Tk):
         corridor_epsg_code: int,
         default_las_epsg_code: Optional[int],
         network_directory: str,
+        link_downloads: bool,
     ) -> None:
         """
         The target function for the processing thread.
         Calls process_corridor and optionally converts output to TXT if requested.
         """
         try:
+            from ..core.file_operations import convert_las_to_txt
+            from ..core.processing import process_corridor
+
             start_time = time.time()
             success = process_corridor(
                 x_start,
@@ -457,6 +498,7 @@ class Application(tk.Tk):
                 queue_obj=self.queue,
                 corridor_epsg_code=corridor_epsg_code,
                 default_las_epsg_code=default_las_epsg_code,
+                link_downloads=link_downloads,
             )
 
             if self.cancel_event.is_set():
@@ -467,7 +509,10 @@ class Application(tk.Tk):
                 hours, rem = divmod(elapsed, 3600)
                 minutes, seconds = divmod(rem, 60)
                 logging.info(
-                    f"Total processing time: {int(hours)}h {int(minutes)}m {seconds:.2f}s"
+                    "Total processing time: %dh %dm %.2fs",
+                    int(hours),
+                    int(minutes),
+                    seconds,
                 )
 
                 if success and export_txt:
@@ -478,41 +523,113 @@ class Application(tk.Tk):
                     )
                     convert_end = time.time()
                     convert_time = convert_end - convert_start
-                    logging.info(f"Conversion time: {convert_time:.2f}s")
+                    logging.info("Conversion time: %.2fs", convert_time)
 
-            # Notify GUI thread that processing is complete
-            self.queue.put("PROCESSING_COMPLETE")
+            # Notify GUI thread that processing is complete. It goes through the
+            # log queue so it arrives after every log record emitted before it
+            self.log_queue.put("PROCESSING_COMPLETE")
 
         except Exception as exc:
-            logging.error(f"Error during processing: {exc}")
-            self.queue.put("PROCESSING_COMPLETE")
+            logging.error("Error during processing: %s", exc)
+            self.log_queue.put("PROCESSING_COMPLETE")
+        finally:
+            # Always the worker's last message; lets a pending close go ahead
+            self.log_queue.put("PROCESSING_EXITED")
 
     def process_queue(self) -> None:
         """
         Poll the GUI queue for messages and update widgets accordingly.
         """
+        # Called both by the timer and by <<LogArrived>>; keep a single timer chain
+        if self.poll_after_id is not None:
+            self.after_cancel(self.poll_after_id)
+            self.poll_after_id = None
+
+        # Push out log entries still waiting for their batch to fill
+        self.queue_handler.flush()
+        num_handled = 0
+        entries: List[str] = []
+        # Only the latest progress value and a single completion are applied
+        last_progress: Optional[int] = None
+        completed = False
+        exited = False
         try:
-            while True:
-                msg = self.queue.get_nowait()
+            while self.queue and num_handled < MAX_MESSAGES_PER_POLL:
+                msg = self.queue.popleft()
+                num_handled += 1
                 if msg == "PROCESSING_COMPLETE":
-                    self.start_button.config(state=tk.NORMAL)
-                    self.cancel_button.config(state=tk.DISABLED)
-                    self.save_log_button.config(state=tk.NORMAL)
-                    self.processing_progress["value"] = 0
+                    completed = True
+                    last_progress = None
+                elif msg == "PROCESSING_EXITED":
+                    exited = True
                 elif isinstance(msg, tuple) and msg[0] == "UPDATE_PROGRESS":
-                    progress_value = int(msg[1])
-                    self.processing_progress["value"] = progress_value
+                    last_progress = int(msg[1])
+                elif isinstance(msg, list):
+                    # Log entries arrive batched as lists from QueueHandler
+                    entries.extend(msg)
                 else:
-                    self.progress_text.config(state=tk.NORMAL)
-                    self.progress_text.insert(tk.END, msg + "\n")
-                    self.progress_text.see(tk.END)
-                    self.progress_text.config(state=tk.DISABLED)
-                    self.messages.append(msg)
-        except queue.Empty:
-            pass
+                    entries.append(msg)
+
+            # One insert and one scroll for everything drained this tick
+            if entries:
+                self.progress_text.config(state=tk.NORMAL)
+                self.progress_text.insert(tk.END, "\n".join(entries) + "\n")
+                self.progress_text.config(state=tk.DISABLED)
+                # Scroll once per idle period, however many polls inserted text
+                if not self.see_pending:
+                    self.see_pending = True
+                    self.after_idle(self.scroll_log_to_end)
+                self.messages.extend(entries)
+            if completed:
+                self.start_button.config(state=tk.NORMAL)
+                self.cancel_button.config(state=tk.DISABLED)
+                self.save_log_button.config(state=tk.NORMAL)
+                self.processing_progress["value"] = 0
+            if last_progress is not None:
+                self.processing_progress["value"] = last_progress
+            if exited:
+                self.processing_running = False
+                if self.close_requested:
+                    self.destroy()
         finally:
-            # Keep polling
-            self.after(100, self.process_queue)
+            # Come back quickly while a backlog remains, otherwise only as a safety net
+            if not self.closing:
+                delay = (
+                    POLL_BUSY_MS
+                    if num_handled == MAX_MESSAGES_PER_POLL
+                    else POLL_IDLE_MS
+                )
+                self.poll_after_id = self.after(delay, self.process_queue)
+
+    def scroll_log_to_end(self) -> None:
+        """
+        Scroll the log view to the newest entry (scheduled via after_idle).
+        """
+        self.see_pending = False
+        self.progress_text.see(tk.END)
+
+    def start_queue_bridge(self) -> None:
+        """
+        Start the thread that turns GUI queue activity into <<LogArrived>> events.
+        Started from the event loop, as event_generate needs a running mainloop.
+        """
+        threading.Thread(target=self.bridge_queue_events, daemon=True).start()
+
+    def bridge_queue_events(self) -> None:
+        """
+        Wait for messages on the GUI queue and wake the Tk event loop for them.
+        """
+        while True:
+            self.queue.arrived.wait()
+            if self.closing:
+                return
+            self.queue.arrived.clear()
+            try:
+                self.event_generate("<<LogArrived>>", when="tail")
+            except (tk.TclError, RuntimeError):
+                return
+            # Let bursts of messages coalesce into a single wakeup
+            time.sleep(POLL_BUSY_MS / 1000)
 
     def setup_logging(self) -> None:
         """
@@ -521,12 +638,30 @@ class Application(tk.Tk):
         for handler in logging.root.handlers[:]:
             logging.root.removeHandler(handler)
 
-        queue_handler = QueueHandler(self.queue)
-        formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-        queue_handler.setFormatter(formatter)
-        logging.getLogger().addHandler(queue_handler)
+        self.queue_handler = QueueHandler(self.queue)
+        formatter = CachedTimeFormatter("%(asctime)s - %(levelname)s - %(message)s")
+        self.queue_handler.setFormatter(formatter)
+
+        # The root handler merges each record's message in the logging thread
+        # (QueueHandler.prepare) and appends it to a SimpleQueue; the timestamped
+        # formatting and batching into the GUI queue run on the listener's thread
+        self.log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.log_listener = GuiQueueListener(
+            self.log_queue, self.queue_handler, respect_handler_level=True
+        )
+        self.log_listener.start()
+        logging.getLogger().addHandler(logging.handlers.QueueHandler(self.log_queue))
         logging.getLogger().setLevel(logging.INFO)
 
+    def destroy(self) -> None:
+        """
+        Stop the log listener thread before tearing down the window.
+        """
+        self.closing = True
+        self.queue.arrived.set()
+        self.log_listener.stop()
+        super().destroy()
+
     def save_log(self) -> None:
         """
         Save the accumulated log messages to a .log file located next to the output LAS file.
@@ -542,23 +677,14 @@ class Application(tk.Tk):
 
         log_file = str(Path(output_file_path).with_suffix(".log"))
         try:
-            with open(log_file, "w", encoding="utf-8") as f:
-                f.write("\n".join(self.messages))
+            # Streamed line by line; unencodable characters are substituted
+            with open(
+                log_file, "w", encoding="utf-8", errors="replace", buffering=1 << 20
+            ) as f:
+                f.writelines(msg + "\n" for msg in self.messages)
             messagebox.showinfo("Success", f"Log saved to {log_file}")
         except Exception as exc:
-            logging.error(f"Failed to save log: {exc}. Trying alternative method.")
-            try:
-                with open(log_file, "w", encoding="utf-8", errors="replace") as f:
-                    sanitized = [
-                        msg.encode("utf-8", errors="replace").decode("utf-8")
-                        for msg in self.messages
-                    ]
-                    f.write("\n".join(sanitized))
-                messagebox.showinfo(
-                    "Success", f"Log saved to {log_file} (with substitution)"
-                )
-            except Exception as exc2:
-                messagebox.showerror("Error", f"Failed to save log: {exc2}")
+            messagebox.showerror("Error", f"Failed to save log: {exc}")
 
     def cancel_processing(self) -> None:
         """
@@ -569,47 +695,34 @@ class Application(tk.Tk):
             self.cancel_button.config(state=tk.DISABLED)
             logging.info("Cancel requested.")
 
-    def check_processing_thread(self) -> None:
-        """
-        Check if the processing thread is still alive and close the application if requested.
-        """
-        if self.processing_thread and self.processing_thread.is_alive():
-            self.after(100, self.check_processing_thread)
-        else:
-            self.destroy()
-
     def on_closing(self) -> None:
         """
         Handle window close event. If a process is running, confirm cancellation before exit.
         """
-        if self.processing_thread and self.processing_thread.is_alive():
+        if self.processing_running:
             if messagebox.askokcancel(
                 "Quit", "Processing in progress. Cancel and exit?"
             ):
                 self.cancel_event.set()
                 self.disable_widgets()
+                # process_queue closes the window once PROCESSING_EXITED arrives
                 self.close_requested = True
-                self.after(100, self.check_processing_thread)
         else:
             self.destroy()
 
     def disable_widgets(self) -> None:
         """
         Disable all widgets to prevent interaction while closing.
+        Walks the widget tree breadth-first with an explicit queue.
         """
-        for widget in self.winfo_children():
-            self.disable_widget_recursive(widget)
-
-    def disable_widget_recursive(self, widget: tk.Widget) -> None:
-        """
-        Recursively disable a widget and its children.
-        """
-        try:
-            widget.config(state=tk.DISABLED)
-        except Exception:
-            pass
-        for child in widget.winfo_children():
-            self.disable_widget_recursive(child)
+        pending = deque(self.winfo_children())
+        while pending:
+            widget = pending.popleft()
+            try:
+                widget.config(state=tk.DISABLED)
+            except Exception:
+                pass
+            pending.extend(widget.winfo_children())
 
 
 if __name__ == "__main__":
@@ -6,16 +6,12 @@ Functions for validating user inputs (EPSG codes, numeric fields, etc.).
 
 from typing import Optional, Tuple
 import math
+import re
 
-try:
-    import tkinter as tk
-    from tkinter import messagebox
-
-    # If you want to handle errors with GUI popups,
-    # keep these imports. Otherwise, handle them differently.
-except ImportError:
-    # If in a non-GUI context, you might do something else
-    pass
+# Decimal numbers as typed into the form (no inf/nan, no digit separators)
+_FLOAT_RE = re.compile(r"[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?")
+_INT_RE = re.compile(r"[-+]?\d+")
+_EPSG_RE = re.compile(r"\d{1,6}")
 
 
 def validate_inputs(
@@ -37,17 +33,28 @@ def validate_inputs(
     Returns:
         (True, None) if valid, otherwise (False, error_message).
     """
-    try:
-        x_start = float(x_start_str)
-        y_start = float(y_start_str)
-        x_end = float(x_end_str)
-        y_end = float(y_end_str)
-        corridor_half_width = float(corridor_half_width_str)
-        nth_point = int(nth_point_str)
-    except ValueError as exc:
-        return False, f"Invalid input: {exc}"
+    float_fields = (
+        ("Start X", x_start_str),
+        ("Start Y", y_start_str),
+        ("End X", x_end_str),
+        ("End Y", y_end_str),
+        ("Corridor half-width", corridor_half_width_str),
+    )
+    for field_name, value in float_fields:
+        if not _FLOAT_RE.fullmatch(value):
+            return False, f"Invalid input for {field_name}: '{value}' is not a number."
+    if not _INT_RE.fullmatch(nth_point_str):
+        return (
+            False,
+            f"Invalid input for Point sampling rate: '{nth_point_str}' "
+            "is not an integer.",
+        )
+
+    # The patterns above guarantee these conversions succeed
+    corridor_half_width = float(corridor_half_width_str)
+    nth_point = int(nth_point_str)
 
-    if corridor_half_width <= 0:
+    if not math.isfinite(corridor_half_width) or corridor_half_width <= 0:
         return False, "Corridor half-width must be a positive number."
     if nth_point <= 0:
         return False, "Point sampling rate must be a positive integer."
@@ -55,29 +62,15 @@ def validate_inputs(
     return True, None
 
 
-def validate_epsg_code(epsg_str: str, field_name: str) -> Optional[int]:
+def validate_epsg_code(epsg_str: str) -> Optional[int]:
     """
-    Validate an EPSG code is a valid integer. If invalid, show an error message or return None.
+    Validate that an EPSG code is a positive integer of up to 6 digits.
 
     Args:
         epsg_str: The EPSG code as a string.
-        field_name: The field name for error messaging.
 
     Returns:
-        The EPSG code as an integer if valid, otherwise None.
+        The EPSG code as an integer if valid, otherwise None. Reporting the error
+        is left to the caller.
     """
-    try:
-        return int(epsg_str)
-    except ValueError:
-        # If you have tkinter installed and want to show a pop-up:
-        try:
-            messagebox.showerror(
-                "Input Error",
-                f"Please enter a valid EPSG code (integer) for {field_name}.",
-            )
-        except:
-            # Fallback if tkinter is not available or messagebox fails
-            print(
-                f"[Error] Invalid EPSG for {field_name}: '{epsg_str}' is not an integer."
-            )
-        return None
+    return int(epsg_str) if _EPSG_RE.fullmatch(epsg_str) else None
@@ -0,0 +1,129 @@
+import json
+import os
+
+import laspy
+import numpy as np
+import pytest
+from pyproj import CRS
+
+from src.core import bbox_index
+from src.core.bbox_index import INDEX_FILENAME, load_or_build_index
+
+
+def _write_las(path, x0, n=100):
+    header = laspy.LasHeader(point_format=3, version="1.2")
+    header.scales = [0.01, 0.01, 0.01]
+    header.offsets = [500000, 5300000, 0]
+    header.add_crs(CRS.from_epsg(25832))
+    las = laspy.LasData(header)
+    las.x = np.linspace(x0, x0 + 1000, n)
+    las.y = np.linspace(5300000, 5300500, n)
+    las.z = np.zeros(n)
+    las.write(path)
+
+
+@pytest.fixture
+def tiles(tmp_path):
+    files = [tmp_path / "a.las", tmp_path / "b.las"]
+    _write_las(files[0], 500000)
+    _write_las(files[1], 501000)
+    return files
+
+
+@pytest.fixture
+def header_reads(monkeypatch):
+    reads = []
+    read_bbox = bbox_index._read_bbox
+
+    def counting_read_bbox(file_path):
+        reads.append(file_path.name)
+        return read_bbox(file_path)
+
+    monkeypatch.setattr(bbox_index, "_read_bbox", counting_read_bbox)
+    return reads
+
+
+def test_index_is_built_then_reused(tiles, header_reads):
+    index = load_or_build_index(tiles)
+    assert index[tiles[0]][:4] == pytest.approx((500000, 5300000, 501000, 5300500))
+    assert CRS.from_wkt(index[tiles[1]][4]).to_epsg() == 25832
+    assert sorted(header_reads) == ["a.las", "b.las"]
+
+    header_reads.clear()
+    assert load_or_build_index(tiles) == index
+    assert header_reads == []
+
+
+@pytest.mark.parametrize("change", ["mtime", "size"])
+def test_stale_entries_are_rebuilt(tiles, header_reads, change):
+    load_or_build_index(tiles)
+    header_reads.clear()
+    if change == "mtime":
+        os.utime(tiles[0], (1_600_000_000, 1_600_000_000))
+    else:
+        _write_las(tiles[0], 502000, n=200)
+
+    index = load_or_build_index(tiles)
+    assert header_reads == ["a.las"]
+    expected_min_x = 500000 if change == "mtime" else 502000
+    assert index[tiles[0]][0] == pytest.approx(expected_min_x)
+    # The refreshed entry is persisted, so the next run reads nothing
+    header_reads.clear()
+    load_or_build_index(tiles)
+    assert header_reads == []
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [
+        '{"a.las": {"mtime": 1',
+        "[1, 2, 3]",
+        '{"a.las": [1, 2], "b.las": {"mtime": "x", "bbox": [0, 0, 1]}}',
+    ],
+    ids=["truncated", "not-a-dict", "malformed-entries"],
+)
+def test_corrupt_index_is_rebuilt(tiles, header_reads, contents):
+    expected = load_or_build_index(tiles)
+    index_path = tiles[0].parent / INDEX_FILENAME
+    index_path.write_text(contents, encoding="utf-8")
+    header_reads.clear()
+
+    assert load_or_build_index(tiles) == expected
+    assert sorted(header_reads) == ["a.las", "b.las"]
+    assert set(json.loads(index_path.read_text(encoding="utf-8"))) == {
+        "a.las",
+        "b.las",
+    }
+
+
+def test_index_is_written_atomically(tiles, monkeypatch):
+    replaced = []
+    replace = os.replace
+
+    def recording_replace(src, dst):
+        # The full index is already on disk under the temporary name
+        assert json.loads(src.read_text(encoding="utf-8")).keys() == {
+            "a.las",
+            "b.las",
+        }
+        replaced.append((src.name, dst.name))
+        replace(src, dst)
+
+    monkeypatch.setattr(bbox_index.os, "replace", recording_replace)
+    load_or_build_index(tiles)
+    assert replaced == [(INDEX_FILENAME + ".tmp", INDEX_FILENAME)]
+    assert not (tiles[0].parent / (INDEX_FILENAME + ".tmp")).exists()
+
+
+def test_unwritable_index_keeps_previous_file(tiles, monkeypatch):
+    index = load_or_build_index(tiles)
+    index_path = tiles[0].parent / INDEX_FILENAME
+    previous = index_path.read_bytes()
+    os.utime(tiles[0], (1_600_000_000, 1_600_000_000))
+
+    def failing_replace(src, dst):
+        raise PermissionError("read-only share")
+
+    monkeypatch.setattr(bbox_index.os, "replace", failing_replace)
+    assert load_or_build_index(tiles) == index
+    assert index_path.read_bytes() == previous
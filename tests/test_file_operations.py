@@ -0,0 +1,133 @@
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import laspy
+import numpy as np
+import pytest
+
+from src.core import file_operations
+from src.core.file_operations import (
+    _copy_one,
+    convert_las_to_txt,
+    download_required_files,
+)
+
+
+def _write_las(path, n=5000, seed=0):
+    rng = np.random.default_rng(seed)
+    header = laspy.LasHeader(point_format=3, version="1.2")
+    header.scales = [0.001, 0.001, 0.001]
+    header.offsets = [500000, 5300000, 0]
+    las = laspy.LasData(header)
+    las.x = rng.uniform(500000, 500100, n)
+    las.y = rng.uniform(5300000, 5300100, n)
+    las.z = rng.uniform(0, 50, n)
+    las.classification = rng.choice([1, 2, 6, 9], n)
+    las.write(path)
+    return las
+
+
+def test_parallel_txt_conversion_matches_serial(tmp_path, monkeypatch):
+    las = _write_las(tmp_path / "t.las")
+    # Force several blocks so the pool has to keep them in order
+    monkeypatch.setattr(file_operations, "_TXT_BLOCK_POINTS", 700)
+
+    monkeypatch.setattr(os, "cpu_count", lambda: 1)
+    assert convert_las_to_txt(tmp_path / "t.las", tmp_path / "serial.txt")
+    monkeypatch.setattr(os, "cpu_count", lambda: 3)
+    pools = []
+
+    class RecordingPool(file_operations.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            pools.append(self)
+
+    monkeypatch.setattr(file_operations, "ProcessPoolExecutor", RecordingPool)
+    assert convert_las_to_txt(tmp_path / "t.las", tmp_path / "parallel.txt")
+    assert len(pools) == 1
+
+    serial = (tmp_path / "serial.txt").read_bytes()
+    assert (tmp_path / "parallel.txt").read_bytes() == serial
+    # Reference: sort by classification, X, Y and format row by row
+    classification = np.asarray(las.classification)
+    x, y, z = np.asarray(las.x), np.asarray(las.y), np.asarray(las.z)
+    order = np.lexsort((las.Y, las.X, classification))
+    expected = "".join(
+        "%d,%.3f,%.3f,%.3f\n" % (classification[i], x[i], y[i], z[i])
+        for i in order
+    )
+    assert serial.decode("ascii") == expected
+
+
+@pytest.fixture
+def network_file(tmp_path):
+    network = tmp_path / "network"
+    network.mkdir()
+    source = network / "t.las"
+    source.write_bytes(b"x" * 1000)
+    # An old, whole-second mtime, as network shares often report
+    os.utime(source, (1_600_000_000, 1_600_000_000))
+    return source
+
+
+def _download(source, local):
+    return download_required_files([source], source.parent, local)
+
+
+def test_download_copies_and_stamps_source_mtime(tmp_path, network_file):
+    local = tmp_path / "local"
+    downloaded, skipped, failed = _download(network_file, local)
+    assert downloaded == [(local / "t.las").resolve()]
+    assert not skipped and not failed
+    copied = local / "t.las"
+    assert copied.read_bytes() == network_file.read_bytes()
+    assert copied.stat().st_mtime == network_file.stat().st_mtime
+    assert not os.path.samefile(copied, network_file)
+
+
+def test_download_skips_unchanged_files(tmp_path, network_file):
+    local = tmp_path / "local"
+    _download(network_file, local)
+    # Within the 2 s tolerance of FAT/SMB timestamps
+    os.utime(local / "t.las", (1_600_000_001, 1_600_000_001))
+    downloaded, skipped, failed = _download(network_file, local)
+    assert not downloaded and not failed
+    assert skipped == ["t.las"]
+
+
+@pytest.mark.parametrize("change", ["size", "mtime"])
+def test_download_recopies_changed_files(tmp_path, network_file, change):
+    local = tmp_path / "local"
+    _download(network_file, local)
+    if change == "size":
+        network_file.write_bytes(b"y" * 2000)
+    else:
+        network_file.write_bytes(b"y" * 1000)
+    os.utime(network_file, (1_600_000_100, 1_600_000_100))
+    downloaded, skipped, _ = _download(network_file, local)
+    assert downloaded == [(local / "t.las").resolve()]
+    assert not skipped
+    assert (local / "t.las").read_bytes() == network_file.read_bytes()
+    assert (local / "t.las").stat().st_mtime == 1_600_000_100
+
+
+@pytest.mark.parametrize("same_device", [True, False], ids=["link", "copy"])
+def test_link_only_on_the_same_device(
+    tmp_path, monkeypatch, network_file, same_device
+):
+    local = tmp_path / "local"
+    local.mkdir()
+    if not same_device:
+        real_stat = Path.stat
+
+        def stat_on_other_device(self, *args, **kwargs):
+            if self == local:
+                return SimpleNamespace(st_dev=real_stat(self).st_dev + 1)
+            return real_stat(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "stat", stat_on_other_device)
+
+    filename, destination, error = _copy_one(network_file, local, True)
+    assert (filename, destination, error) == ("t.las", local / "t.las", None)
+    assert os.path.samefile(destination, network_file) == same_device
@@ -0,0 +1,123 @@
+import numpy as np
+import pytest
+import shapely
+from shapely.geometry import Point, Polygon
+
+from src.core import geometry
+from src.core.geometry import (
+    calculate_corridor_polygon,
+    points_in_convex_quad,
+    points_in_polygon_chunk,
+)
+
+
+def _random_points(polygon, n=50_000, seed=0):
+    rng = np.random.default_rng(seed)
+    min_x, min_y, max_x, max_y = polygon.bounds
+    pad_x, pad_y = (max_x - min_x) * 0.2, (max_y - min_y) * 0.2
+    x = rng.uniform(min_x - pad_x, max_x + pad_x, n)
+    y = rng.uniform(min_y - pad_y, max_y + pad_y, n)
+    return x, y
+
+
+@pytest.fixture(params=[True, False], ids=["numba", "numpy"])
+def numba_usable(request, monkeypatch):
+    if request.param and not geometry.NUMBA_AVAILABLE:
+        pytest.skip("numba not installed")
+    monkeypatch.setattr(geometry, "_numba_usable", request.param)
+    return request.param
+
+
+def test_corridor_polygon_extends_past_both_ends():
+    polygon = calculate_corridor_polygon(0, 0, 100, 0, 10)
+    assert polygon.bounds == pytest.approx((-10, -10, 110, 10))
+    assert polygon.area == pytest.approx(120 * 20)
+
+
+def test_convex_quad_matches_shapely(numba_usable):
+    polygon = calculate_corridor_polygon(500200, 5300300, 501900, 5301600, 60)
+    strategy, corners = geometry._pip_strategy(polygon)
+    assert strategy == "quad"
+    x, y = _random_points(polygon)
+    expected = shapely.contains_xy(polygon, x, y)
+    assert np.array_equal(points_in_convex_quad(x, y, corners), expected)
+    assert np.array_equal(points_in_polygon_chunk(x, y, polygon), expected)
+
+
+def test_convex_quad_excludes_boundary(numba_usable):
+    polygon = Polygon([(0, 0), (10, 0), (10, 10), (0, 10)])
+    strategy, corners = geometry._pip_strategy(polygon)
+    assert strategy == "quad"
+    # Edge midpoints and a corner are outside, as with shapely's contains
+    x = np.array([0.0, 5.0, 10.0, 10.0, 5.0, 11.0])
+    y = np.array([5.0, 0.0, 5.0, 10.0, 5.0, 5.0])
+    expected = [False, False, False, False, True, False]
+    assert shapely.contains_xy(polygon, x, y).tolist() == expected
+    assert points_in_convex_quad(x, y, corners).tolist() == expected
+    assert points_in_polygon_chunk(x, y, polygon).tolist() == expected
+
+
+def test_ray_crossing_matches_shapely(numba_usable):
+    polygon = Point(1000, 2000).buffer(50, quad_segs=16)
+    assert geometry._pip_strategy(polygon)[0] == (
+        "ray" if geometry.NUMBA_AVAILABLE else "geos"
+    )
+    x, y = _random_points(polygon, seed=1)
+    expected = shapely.contains_xy(polygon, x, y)
+    assert np.array_equal(points_in_polygon_chunk(x, y, polygon), expected)
+
+
+def test_ray_crossing_excludes_boundary(numba_usable):
+    # Plus-shaped 12-gon: no quad fast path, no holes
+    polygon = Polygon(
+        [(3, 0), (6, 0), (6, 3), (9, 3), (9, 6), (6, 6)]
+        + [(6, 9), (3, 9), (3, 6), (0, 6), (0, 3), (3, 3)]
+    )
+    x = np.array([3.0, 6.0, 4.5, 0.0, 9.0, 4.5, 3.0, 6.0, 4.5, 4.5])
+    y = np.array([1.0, 1.0, 0.0, 4.5, 4.5, 9.0, 3.0, 6.0, 4.5, 2.0])
+    expected = [False] * 8 + [True, True]
+    assert shapely.contains_xy(polygon, x, y).tolist() == expected
+    assert points_in_polygon_chunk(x, y, polygon).tolist() == expected
+
+
+def test_polygon_with_hole_matches_shapely():
+    polygon = Polygon(
+        [(0, 0), (10, 0), (10, 10), (0, 10)], [[(3, 3), (7, 3), (7, 7), (3, 7)]]
+    )
+    assert geometry._pip_strategy(polygon)[0] == "geos"
+    x, y = _random_points(polygon, seed=2)
+    expected = shapely.contains_xy(polygon, x, y)
+    assert np.array_equal(points_in_polygon_chunk(x, y, polygon), expected)
+
+
+def test_sparse_candidates_and_reused_buffer():
+    polygon = calculate_corridor_polygon(0, 0, 10, 10, 1)
+    # Mostly far outside the bbox, so the gather/scatter path is used
+    x, y = _random_points(Polygon([(-500, -500), (500, -500), (500, 500)]), seed=3)
+    out = np.ones(x.shape, dtype=bool)
+    result = points_in_polygon_chunk(x, y, polygon, out=out)
+    assert result is out
+    assert np.array_equal(result, shapely.contains_xy(polygon, x, y))
+
+
+@pytest.mark.parametrize(
+    "kernel, polygon",
+    [
+        ("pip_quad", calculate_corridor_polygon(0, 0, 100, 50, 5)),
+        ("pip_ray", Point(0, 0).buffer(50, quad_segs=16)),
+    ],
+    ids=["quad", "ray"],
+)
+def test_failing_kernel_falls_back(monkeypatch, kernel, polygon):
+    if not geometry.NUMBA_AVAILABLE:
+        pytest.skip("numba not installed")
+
+    def broken_kernel(*args):
+        raise ModuleNotFoundError("No module named 'pk'")
+
+    monkeypatch.setattr(geometry, "_numba_usable", True)
+    monkeypatch.setattr(geometry, kernel, broken_kernel)
+    x, y = _random_points(polygon, seed=4)
+    result = points_in_polygon_chunk(x, y, polygon)
+    assert np.array_equal(result, shapely.contains_xy(polygon, x, y))
+    assert geometry._numba_usable is False
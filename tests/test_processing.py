@@ -0,0 +1,244 @@
+import os
+import queue
+import threading
+
+import laspy
+import numpy as np
+import pytest
+import shapely
+from pyproj import CRS, Transformer
+
+from src.core import processing
+from src.core.geometry import calculate_corridor_polygon, transform_polygon
+from src.core.processing import (
+    _CorridorProgress,
+    _quantize,
+    iter_chunks_in_polygon,
+    order_files_along_corridor,
+    process_corridor,
+)
+
+
+def _write_las(path, x, y, z, epsg=25832):
+    header = laspy.LasHeader(point_format=3, version="1.2")
+    header.scales = [0.01, 0.01, 0.01]
+    header.offsets = [500000, 5300000, 0]
+    if epsg is not None:
+        header.add_crs(CRS.from_epsg(epsg))
+    las = laspy.LasData(header)
+    las.x, las.y, las.z = x, y, z
+    las.write(path)
+
+
+def test_quantize_rounds_to_grid():
+    out = np.zeros(3, dtype=np.int32)
+    _quantize(np.array([100.004, 100.006, 99.995]), 100.0, 0.01, out)
+    assert out.tolist() == [0, 1, 0]
+
+
+@pytest.mark.parametrize("values", [[0.0, 3e7], [-3e7, 0.0], [np.inf], [np.nan]])
+def test_quantize_overflow_raises(values):
+    out = np.zeros(len(values), dtype=np.int32)
+    with pytest.raises(OverflowError):
+        _quantize(np.array(values), 0.0, 0.01, out)
+    assert not out.any()
+
+
+def test_quantize_empty():
+    _quantize(np.array([]), 0.0, 0.01, np.zeros(0, dtype=np.int32))
+
+
+def test_chunks_outside_polygon_are_skipped_but_counted(tmp_path):
+    # Four 1000-point chunks along x; only the third reaches the polygon
+    x = np.repeat([500000.0, 500100.0, 500200.0, 500300.0], 1000)
+    x += np.tile(np.linspace(0, 50, 1000), 4)
+    _write_las(tmp_path / "t.las", x, np.full(x.size, 5300500.0), np.zeros(x.size))
+    polygon = calculate_corridor_polygon(500220, 5300500, 500240, 5300500, 5)
+    skipped = []
+    with laspy.open(tmp_path / "t.las") as reader:
+        chunks = list(
+            iter_chunks_in_polygon(reader, polygon, 1000, on_skip=skipped.append)
+        )
+    assert [points_read for points_read, _ in chunks] == [3000]
+    assert chunks[0][1].x.min() == pytest.approx(500200)
+    assert skipped == [1000, 2000, 4000]
+
+
+def _write_tile_at(path, center_x, center_y, epsg=25832):
+    x = np.array([center_x - 400, center_x + 400])
+    y = np.array([center_y - 400, center_y + 400])
+    _write_las(path, x, y, np.zeros(2), epsg=epsg)
+
+
+@pytest.mark.parametrize("reverse", [False, True], ids=["forward", "reversed"])
+def test_files_ordered_along_corridor(tmp_path, reverse):
+    # Diagonal corridor; tiles are named out of order and sit off the axis
+    _write_tile_at(tmp_path / "a.las", 502500, 5302500)
+    _write_tile_at(tmp_path / "b.las", 500500, 5300500)
+    _write_tile_at(tmp_path / "c.las", 502000, 5300000)
+    # Centred at (501500, 5301500) in 25832, stored in 25833
+    x, y = Transformer.from_crs(25832, 25833, always_xy=True).transform(
+        501500, 5301500
+    )
+    _write_tile_at(tmp_path / "d.las", x, y, epsg=25833)
+    # No CRS and no default: cannot be placed, so it goes last
+    _write_tile_at(tmp_path / "e.las", 500000, 5300000, epsg=None)
+
+    files = sorted(tmp_path.glob("*.las"))
+    start, end = (500000, 5300000), (503000, 5303000)
+    if reverse:
+        start, end = end, start
+    ordered = order_files_along_corridor(files, *start, *end, CRS.from_epsg(25832))
+    # c projects onto the axis at (501000, 5301000), before d
+    expected = ["b.las", "c.las", "d.las", "a.las"]
+    if reverse:
+        expected.reverse()
+    assert [f.name for f in ordered] == expected + ["e.las"]
+
+
+def test_corridor_progress_is_monotonic():
+    progress_queue = queue.Queue()
+    progress = _CorridorProgress(progress_queue, [300, 100])
+    for file_index, percent in ((0, 50), (1, 100), (0, 100)):
+        progress.for_file(file_index).put(("UPDATE_PROGRESS", percent))
+    sent = [progress_queue.get_nowait()[1] for _ in range(progress_queue.qsize())]
+    assert sent == [37, 62, 100]
+
+
+@pytest.mark.parametrize("cpu_count", [1, 4], ids=["sequential", "threaded"])
+def test_process_corridor_keeps_points_inside(tmp_path, monkeypatch, cpu_count):
+    # More than one worker merges per-file part files into the output
+    monkeypatch.setattr(os, "cpu_count", lambda: cpu_count)
+    rng = np.random.default_rng(0)
+    tiles = tmp_path / "tiles"
+    tiles.mkdir()
+    expected = 0
+    polygon = calculate_corridor_polygon(500100, 5300100, 501800, 5300900, 40)
+    for i, x0 in enumerate((500000, 501000)):
+        x = rng.uniform(x0, x0 + 1000, 200_000)
+        y = rng.uniform(5300000, 5301000, 200_000)
+        _write_las(tiles / f"t{i}.las", x, y, rng.uniform(0, 50, x.size))
+        # Compare on the stored (quantized) coordinates
+        las = laspy.read(tiles / f"t{i}.las")
+        expected += np.count_nonzero(
+            shapely.contains_xy(polygon, np.asarray(las.x), np.asarray(las.y))
+        )
+
+    output = tmp_path / "out.las"
+    ok = process_corridor(
+        500100,
+        5300100,
+        501800,
+        5300900,
+        40,
+        str(tiles),
+        str(output),
+        corridor_epsg_code=25832,
+    )
+    assert ok
+    assert laspy.read(output).header.point_count == expected
+    assert not list(tmp_path.glob("out.part*"))
+
+
+def _write_tile(path, n=50_000, seed=0):
+    rng = np.random.default_rng(seed)
+    x = rng.uniform(500000, 501000, n)
+    y = rng.uniform(5300000, 5301000, n)
+    _write_las(path, x, y, rng.uniform(0, 50, n))
+    return laspy.read(path)
+
+
+def test_reprojected_points_match_reference(tmp_path):
+    tile = _write_tile(tmp_path / "t.las")
+    to_utm33 = Transformer.from_crs(25832, 25833, always_xy=True)
+    (x0, x1), (y0, y1) = to_utm33.transform([500100, 500900], [5300200, 5300800])
+    output = tmp_path / "out" / "out.las"
+    ok = process_corridor(
+        x0, y0, x1, y1, 50, str(tmp_path), str(output), corridor_epsg_code=25833
+    )
+    assert ok
+
+    # Filter in the tile's CRS, then transform and round onto the output grid
+    polygon = transform_polygon(
+        calculate_corridor_polygon(x0, y0, x1, y1, 50),
+        CRS.from_epsg(25833),
+        CRS.from_epsg(25832),
+    )
+    inside = shapely.contains_xy(polygon, np.asarray(tile.x), np.asarray(tile.y))
+    x, y = to_utm33.transform(np.asarray(tile.x)[inside], np.asarray(tile.y)[inside])
+    out = laspy.read(output)
+    assert out.header.parse_crs().to_epsg() == 25833
+    assert 0 < out.header.point_count < len(tile.points)
+    assert np.array_equal(out.X, np.rint((x - 500000) / 0.01))
+    assert np.array_equal(out.Y, np.rint((y - 5300000) / 0.01))
+    assert np.array_equal(out.Z, tile.Z[inside])
+
+
+def test_same_crs_skips_requantization(tmp_path, monkeypatch):
+    def fail_quantize(*args):
+        raise AssertionError("same-CRS records must be written unchanged")
+
+    monkeypatch.setattr(processing, "_quantize", fail_quantize)
+    tile = _write_tile(tmp_path / "t.las", seed=1)
+    output = tmp_path / "out" / "out.las"
+    ok = process_corridor(
+        500100,
+        5300200,
+        500900,
+        5300800,
+        50,
+        str(tmp_path),
+        str(output),
+        corridor_epsg_code=25832,
+    )
+    assert ok
+
+    polygon = calculate_corridor_polygon(500100, 5300200, 500900, 5300800, 50)
+    inside = shapely.contains_xy(polygon, np.asarray(tile.x), np.asarray(tile.y))
+    out = laspy.read(output)
+    assert 0 < out.header.point_count < len(tile.points)
+    assert np.array_equal(out.points.array, tile.points.array[inside])
+
+
+def test_process_corridor_cancelled(tmp_path):
+    x = np.linspace(500000, 501000, 1000)
+    _write_las(tmp_path / "t.las", x, np.full(x.size, 5300500.0), np.zeros(x.size))
+    cancel_event = threading.Event()
+    cancel_event.set()
+    ok = process_corridor(
+        500100,
+        5300500,
+        500900,
+        5300500,
+        10,
+        str(tmp_path),
+        str(tmp_path / "out" / "out.las"),
+        cancel_event=cancel_event,
+        corridor_epsg_code=25832,
+    )
+    assert not ok
+
+
+@pytest.mark.parametrize("link_downloads", [False, True], ids=["copy", "link"])
+def test_download_mode_copies_unless_linking_requested(tmp_path, link_downloads):
+    network = tmp_path / "network"
+    local = tmp_path / "local"
+    network.mkdir()
+    x = np.linspace(500000, 501000, 1000)
+    _write_las(network / "t.las", x, np.full(x.size, 5300500.0), np.zeros(x.size))
+    ok = process_corridor(
+        500100,
+        5300500,
+        500900,
+        5300500,
+        10,
+        str(local),
+        str(tmp_path / "out.las"),
+        source_option=3,
+        network_directory=str(network),
+        corridor_epsg_code=25832,
+        link_downloads=link_downloads,
+    )
+    assert ok
+    # A hardlink shares the network file's inode; a copy must not
+    assert os.path.samefile(local / "t.las", network / "t.las") == link_downloads
@@ -0,0 +1,68 @@
+import pytest
+
+from src.utils.validators import validate_epsg_code, validate_inputs
+
+
+def _inputs(x_start="0", half_width="10", nth_point="1"):
+    return validate_inputs(x_start, "0", "100", "0", half_width, nth_point)
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["1", "-1", "+1", "1.", ".5", "-.5", "1.5e3", "1E-3", "+2.5e+2", "500000.123"],
+)
+def test_accepts_decimal_numbers(value):
+    assert _inputs(x_start=value) == (True, None)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "",
+        ".",
+        "e3",
+        "1e",
+        "1.5.2",
+        "--1",
+        "1_000",
+        "1,5",
+        "0x10",
+        "inf",
+        "-inf",
+        "nan",
+        "Infinity",
+        " 1",
+        "1 ",
+    ],
+)
+def test_rejects_non_numbers(value):
+    ok, message = _inputs(x_start=value)
+    assert not ok
+    assert "Start X" in message
+
+
+@pytest.mark.parametrize("value", ["0", "-5", "1e400", "inf", "nan"])
+def test_rejects_non_positive_or_infinite_half_width(value):
+    ok, _ = _inputs(half_width=value)
+    assert not ok
+
+
+@pytest.mark.parametrize("value", ["0", "-1", "1.5", "2e3", ""])
+def test_rejects_invalid_sampling_rate(value):
+    ok, _ = _inputs(nth_point=value)
+    assert not ok
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("4326", 4326), ("25832", 25832), ("102100", 102100), ("1", 1)],
+)
+def test_epsg_code_valid(value, expected):
+    assert validate_epsg_code(value) == expected
+
+
+@pytest.mark.parametrize(
+    "value", ["", "1234567", "-4326", "+4326", "4326.0", "EPSG:4326", " 4326"]
+)
+def test_epsg_code_invalid(value):
+    assert validate_epsg_code(value) is None